@@ -1,8 +1,11 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+
+from backend.core.sdm.encoder import encode_text as encode_sdr
+from backend.core.sdm.utils import bits_to_base64
 
 router = APIRouter()
 
 @router.post("/")
-async def encode_text(text: str):
-    # Placeholder: replace with actual encoding logic
-    return {"encoded_vector": f"encoded({text})"}
\ No newline at end of file
+async def encode_text(text: str, vector_dim: int = Query(1024, ge=8, le=65536)):
+    # Packed like the {"vector_b64", "dim"} bodies /store and /query accept
+    return {"encoded_vector": bits_to_base64(encode_sdr(text, vector_dim)), "dim": vector_dim}
\ No newline at end of file
@@ -1,12 +1,46 @@
+import multiprocessing
+import os
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
+from .responses import ORJSONResponse
 from .encode.routes import router as encode_router
 from .store.routes import router as store_router
 from .query.routes import router as query_router
 from backend.api.tests.memory_test.routes import router as memory_test_router
 from backend.api.tests.benchmark_results import router as benchmark_router
 
-app = FastAPI()
+
+def _pool_size() -> int:
+    """SDM_POOL_WORKERS, else this uvicorn worker's share of the cores"""
+    if "SDM_POOL_WORKERS" in os.environ:
+        return int(os.environ["SDM_POOL_WORKERS"])
+    return max(1, (os.cpu_count() or 1) // int(os.environ.get("WEB_CONCURRENCY", 1)))
+
+def _init_pool_worker():
+    """Pin each pool worker's Numba kernels to one thread (the pool already spreads over the cores)"""
+    try:
+        import numba
+        numba.set_num_threads(1)
+    except ImportError:
+        pass
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # CPU-bound SDM runs are sent here so they never block the event loop.
+    # Spawned, not forked: forking after Numba's thread pool has started can hang
+    app.state.process_pool = ProcessPoolExecutor(max_workers=_pool_size(),
+                                                 mp_context=multiprocessing.get_context("spawn"),
+                                                 initializer=_init_pool_worker)
+    yield
+    app.state.process_pool.shutdown()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+# Memory-test statistics and benchmark CSV dumps compress well; small replies are left as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 @app.get("/")
 async def root():
@@ -16,4 +50,15 @@ app.include_router(encode_router, prefix="/encode", tags=["encode"])
 app.include_router(store_router, prefix="/store", tags=["store"])
 app.include_router(query_router, prefix="/query", tags=["query"])
 app.include_router(memory_test_router, prefix="/test/memory", tags=["tests"])
-app.include_router(benchmark_router, prefix="/benchmark", tags=["benchmark"])
\ No newline at end of file
+app.include_router(benchmark_router, prefix="/benchmark", tags=["benchmark"])
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools (from uvicorn[standard]) cut per-request loop and parser overhead
+    uvicorn.run(
+        "backend.api.main:app",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1))
+    )
\ No newline at end of file
@@ -1,8 +1,11 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+
+from ..vectors import read_vector_body
 
 router = APIRouter()
 
 @router.post("/")
-async def query_vector(vector: list[int]):
+async def query_vector(request: Request):
+    vector = await read_vector_body(request)
     # Placeholder: replace with actual query logic
     return {"result": f"query_result_for_vector_length_{len(vector)}"}
\ No newline at end of file
@@ -1,8 +1,11 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+
+from ..vectors import read_vector_body
 
 router = APIRouter()
 
 @router.post("/")
-async def store_vector(vector: list[int]):
+async def store_vector(request: Request):
+    vector = await read_vector_body(request)
     # Placeholder: replace with actual store logic
     return {"status": "stored", "vector_length": len(vector)}
\ No newline at end of file
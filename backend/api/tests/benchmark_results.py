@@ -1,9 +1,32 @@
 from pathlib import Path
+from functools import lru_cache, partial
+from itertools import product
+from typing import Annotated
+import asyncio
 import csv
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from backend.core.sdm.memory import run_sdm_memory_test_sweep
 
 router = APIRouter()
 
+class SweepSpec(BaseModel):
+    """Benchmark grid: every (vector_dim, num_locations) cell runs every radius factor"""
+    vector_dims: list[Annotated[int, Field(ge=8, le=1024)]] = Field(min_length=1)
+    num_locations_list: list[Annotated[int, Field(ge=100, le=10000)]] = Field(min_length=1)
+    radius_factors: list[Annotated[float, Field(gt=0, lt=1)]] = Field(min_length=1)
+    reinforce: int = Field(30, ge=1, le=100)
+
+@lru_cache(maxsize=4)
+def _load_results(csv_path: str, mtime_ns: int) -> bytes:
+    """Parse the CSV and pre-serialize the JSON body; keyed by mtime so a rerun invalidates it"""
+    with open(csv_path, newline="") as csvfile:
+        reader = csv.DictReader(csvfile)
+        rows = list(reader)
+    return orjson.dumps({"results": rows})
+
 @router.get("/results")
 async def get_benchmark_results():
     # Path relative to this file
@@ -12,8 +35,40 @@ async def get_benchmark_results():
     if not csv_output_path.exists():
         raise HTTPException(status_code=404, detail="Benchmark results not found")
 
-    with open(csv_output_path, newline="") as csvfile:
-        reader = csv.DictReader(csvfile)
-        rows = list(reader)
+    # File I/O and parsing run in the default thread pool (only on a cache miss)
+    mtime_ns = csv_output_path.stat().st_mtime_ns
+    loop = asyncio.get_running_loop()
+    body = await loop.run_in_executor(None, _load_results, str(csv_output_path), mtime_ns)
+
+    return Response(content=body, media_type="application/json")
+
+@router.post("/sweep")
+async def run_benchmark_sweep(spec: SweepSpec, request: Request):
+    """
+    Run a benchmark sweep on the server, streamed as NDJSON.
+
+    Cells run in the app's process pool; each one writes a line per radius
+    factor (the memory-test summary plus `radius_factor`) as soon as it
+    completes, so large cells do not hold back small ones.
+    """
+    loop = asyncio.get_running_loop()
+    pool = request.app.state.process_pool
+
+    async def rows():
+        cells = []
+        for vector_dim, num_locations in product(spec.vector_dims, spec.num_locations_list):
+            radii = [max(1, int(vector_dim * factor)) for factor in spec.radius_factors]
+            cells.append(loop.run_in_executor(
+                pool, partial(run_sdm_memory_test_sweep, vector_dim, num_locations, radii,
+                              spec.reinforce)))
+        try:
+            for cell in asyncio.as_completed(cells):
+                for factor, result in zip(spec.radius_factors, await cell):
+                    row = dict(result["summary"], radius_factor=factor)
+                    yield orjson.dumps(row, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+        finally:
+            # Client went away: drop the cells that have not started yet
+            for cell in cells:
+                cell.cancel()
 
-    return {"results": rows}
\ No newline at end of file
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
@@ -1,23 +1,35 @@
-from fastapi.responses import JSONResponse
-import json
-from fastapi import APIRouter, Query, HTTPException
+import asyncio
+from functools import partial
+from fastapi import APIRouter, Query, HTTPException, Request
+from backend.api.responses import ORJSONResponse
 from backend.core.sdm.memory import run_sdm_memory_test
 
 router = APIRouter()
 
 @router.get("/run")
-def test_memory(
+async def test_memory(
+    request: Request,
     vector_dim: int = Query(32, ge=8, le=1024),
     num_locations: int = Query(3000, ge=100, le=10000),
     access_radius: int = Query(18, ge=1),
-    reinforce: int = Query(30, ge=1, le=100)
+    reinforce: int = Query(30, ge=1, le=100),
+    include_vectors: bool = Query(False)
 ):
+    """
+    Run a single SDM write/read test.
+
+    With `include_vectors=true`, `input_vector` and `recalled_vector` are added
+    as base64 strings of the np.packbits bytes (MSB first); decode with atob +
+    Uint8Array and take the first `vector_dim` bits.
+    """
     if access_radius >= vector_dim:
         raise HTTPException(status_code=400, detail="access_radius must be less than vector_dim")
-    result = run_sdm_memory_test(vector_dim, num_locations, access_radius, reinforce)
-    # Return compact JSON response
-    return JSONResponse(
-        content=result,
-        media_type="application/json",
-        dumps=lambda obj, *, default=None: json.dumps(obj, separators=(',', ':'))
-    )
\ No newline at end of file
+    # Run the CPU-bound SDM test in the app's process pool
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        request.app.state.process_pool,
+        partial(run_sdm_memory_test, vector_dim, num_locations, access_radius, reinforce,
+                include_vectors=include_vectors)
+    )
+    # Compact orjson response; returning it directly skips jsonable_encoder
+    return ORJSONResponse(content=result)
\ No newline at end of file
@@ -0,0 +1,171 @@
+# backend/core/sdm/_kernels.py
+"""
+Numba-compiled SDM kernels.
+
+Each kernel fuses the XOR + popcount address scan with the memory update (or
+recall accumulation) so the address table and the counter matrix are walked
+once, without the temporaries the NumPy path allocates. Numba is optional:
+when it is not installed NUMBA_AVAILABLE is False and SparseDistributedMemory
+keeps using the NumPy implementation.
+
+Kernels are compiled for the host CPU, so popcount lowers to POPCNT / CNT and
+the word loops vectorise with whatever SIMD width the machine offers.
+"""
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange, types
+    from numba.extending import intrinsic
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+
+    @intrinsic
+    def popcount64(typingctx, x):
+        """LLVM ctpop on a uint64 word (lowers to POPCNT / CNT on the host CPU)"""
+        sig = types.uint64(types.uint64)
+
+        def codegen(context, builder, signature, args):
+            return builder.ctpop(args[0])
+
+        return sig, codegen
+
+    @njit(parallel=True, cache=True)
+    def hamming_scan(addresses, packed_query):
+        """Hamming distance from `packed_query` to every packed address row"""
+        num_locations, num_words = addresses.shape
+        dists = np.empty(num_locations, dtype=np.int64)
+        for i in prange(num_locations):
+            d = 0
+            for w in range(num_words):
+                d += popcount64(addresses[i, w] ^ packed_query[w])
+            dists[i] = d
+        return dists
+
+    @njit(parallel=True, cache=True)
+    def hamming_scan_single_word(addresses, packed_query):
+        """hamming_scan specialised for vector_dim <= 64 (one word per address, no word loop)"""
+        num_locations = addresses.shape[0]
+        query = packed_query[0]
+        dists = np.empty(num_locations, dtype=np.int64)
+        for i in prange(num_locations):
+            dists[i] = popcount64(addresses[i, 0] ^ query)
+        return dists
+
+    @njit(parallel=True, cache=True)
+    def hamming_scan_batch(addresses, packed_queries):
+        """(B, N) Hamming distances from every packed query row to every address row"""
+        num_locations, num_words = addresses.shape
+        num_queries = packed_queries.shape[0]
+        dists = np.empty((num_queries, num_locations), dtype=np.int64)
+        for i in prange(num_locations):
+            for q in range(num_queries):
+                d = 0
+                for w in range(num_words):
+                    d += popcount64(addresses[i, w] ^ packed_queries[q, w])
+                dists[q, i] = d
+        return dists
+
+    @njit(cache=True)
+    def min_hamming(packed_patterns, packed_query):
+        """
+        Smallest Hamming distance from `packed_query` to any packed pattern row.
+
+        A row is abandoned as soon as its partial distance reaches the best
+        distance found so far, and the scan stops on an exact match. Returns -1
+        when there are no rows.
+        """
+        num_patterns, num_words = packed_patterns.shape
+        best = -1
+        for i in range(num_patterns):
+            d = 0
+            for w in range(num_words):
+                d += popcount64(packed_patterns[i, w] ^ packed_query[w])
+                if best >= 0 and d >= best:
+                    break
+            if best < 0 or d < best:
+                best = d
+                if best == 0:
+                    break
+        return best
+
+    @njit(cache=True)
+    def first_k_ones(pattern, k):
+        """Indices of the first `k` entries equal to 1, stopping as soon as k are found"""
+        out = np.empty(k, dtype=np.int32)
+        j = 0
+        if k == 0:
+            return out
+        for i in range(pattern.size):
+            if pattern[i] == 1:
+                out[j] = i
+                j += 1
+                if j == k:
+                    break
+        return out[:j]
+
+    @njit(parallel=True, cache=True)
+    def sdm_write(addresses, memory, packed_input, delta, radius, access_counts):
+        """
+        Add `delta` to every location within `radius` of `packed_input`.
+
+        Returns the Hamming distance to every location.
+        """
+        num_locations, num_words = addresses.shape
+        vector_dim = memory.shape[1]
+        dists = np.empty(num_locations, dtype=np.int64)
+        for i in prange(num_locations):
+            d = 0
+            for w in range(num_words):
+                d += popcount64(addresses[i, w] ^ packed_input[w])
+            dists[i] = d
+            if d <= radius:
+                access_counts[i] += 1
+                for j in range(vector_dim):
+                    memory[i, j] += delta[j]
+        return dists
+
+    @njit(parallel=True, cache=True)
+    def sdm_read(addresses, memory, packed_query, radius, total, num_threads):
+        """
+        Accumulate the inverse-distance weighted sum of activated rows into `total`.
+
+        One fused pass: each location's distance is computed and, when it is
+        within `radius`, its row is added straight into a per-thread partial
+        sum, so no weight vector is materialised and the counter matrix is
+        streamed once. The partials are combined and normalised at the end.
+        `num_threads` sets the number of partial sums (pass get_num_threads()).
+
+        Returns the Hamming distance to every location.
+        """
+        num_locations, num_words = addresses.shape
+        vector_dim = memory.shape[1]
+        dists = np.empty(num_locations, dtype=np.int64)
+        num_chunks = max(1, min(num_threads, num_locations))
+        partials = np.zeros((num_chunks, vector_dim))
+        weight_sums = np.zeros(num_chunks)
+        for c in prange(num_chunks):
+            acc = partials[c]
+            for i in range(c * num_locations // num_chunks, (c + 1) * num_locations // num_chunks):
+                d = 0
+                for w in range(num_words):
+                    d += popcount64(addresses[i, w] ^ packed_query[w])
+                dists[i] = d
+                if d <= radius:
+                    weight = 1.0 / (1.0 + d)
+                    weight_sums[c] += weight
+                    for j in range(vector_dim):
+                        acc[j] += weight * memory[i, j]
+
+        weight_sum = weight_sums.sum()
+        if weight_sum == 0.0:
+            return dists
+        for c in range(num_chunks):
+            for j in range(vector_dim):
+                total[j] += partials[c, j]
+        for j in range(vector_dim):
+            total[j] /= weight_sum
+        return dists
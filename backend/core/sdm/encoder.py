@@ -0,0 +1,54 @@
+import hashlib
+
+import numpy as np
+
+# splitmix64 constants (uint64 arrays wrap on overflow, which the mixer relies on)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _token_seeds(tokens) -> np.ndarray:
+    """Stable 64-bit seed per token (blake2b, unlike hash() which is salted per process)"""
+    return np.array([int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+                     for token in tokens], dtype=np.uint64)
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Elementwise splitmix64 finaliser over a uint64 array"""
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+def encode_text(text: str, vector_dim: int = 1024, sparsity: float = 0.03) -> np.ndarray:
+    """
+    Encode text as a sparse binary vector (SDR).
+
+    Each whitespace token (lower-cased) hashes to `num_active` pseudo-random bit
+    positions; positions are scored by how many tokens picked them and the
+    `num_active` best win, so texts that share words share bits. Only the
+    per-token digest is a Python loop: the positions for every token are
+    generated, counted and selected as whole arrays.
+
+    Args:
+        text: Text to encode
+        vector_dim: Bits in the output vector
+        sparsity: Fraction of bits set (num_active = vector_dim * sparsity)
+    Returns:
+        uint8 array of shape (vector_dim,) with at most num_active ones
+    """
+    vector = np.zeros(vector_dim, dtype=np.uint8)
+    tokens = text.lower().split()
+    if not tokens:
+        return vector
+    num_active = max(1, int(vector_dim * sparsity))
+
+    # (tokens, num_active) bit positions: a splitmix64 stream seeded per token
+    steps = np.arange(1, num_active + 1, dtype=np.uint64) * _GOLDEN
+    positions = _splitmix64(_token_seeds(tokens)[:, None] + steps) % np.uint64(vector_dim)
+    votes = np.bincount(positions.ravel().astype(np.intp), minlength=vector_dim)
+
+    winners = np.argpartition(-votes, num_active - 1)[:num_active]
+    vector[winners[votes[winners] > 0]] = 1
+    return vector
@@ -1,6 +1,7 @@
 # backend/core/sdm/hierarchy/complexity_analyzer.py
 
 import numpy as np
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Any
 from enum import Enum
 
@@ -25,25 +26,104 @@ class SDMProblemType(Enum):
     PATTERN_OPTIMIZATION = "pattern_optimization"
     MEMORY_ALLOCATION = "memory_allocation"
 
+# Per-problem lookup tables, built once at import instead of if/elif chains per call
+
+_DEFAULT_SCALABILITY = MappingProxyType({
+    'vector_dimension': 'linear',
+    'num_locations': 'linear', 
+    'num_patterns': 'linear',
+    'overall': 'polynomial'
+})
+
+_SCALABILITY_TABLE = MappingProxyType({
+    SDMProblemType.HAMMING_DISTANCE: MappingProxyType({
+        **_DEFAULT_SCALABILITY,
+        'vector_dimension': 'linear',
+        'overall': 'linear'
+    }),
+    SDMProblemType.OPTIMAL_RADIUS: MappingProxyType({
+        **_DEFAULT_SCALABILITY,
+        'vector_dimension': 'exponential',
+        'num_patterns': 'exponential',
+        'overall': 'exponential'
+    }),
+    SDMProblemType.SWARM_COORDINATION: MappingProxyType({
+        **_DEFAULT_SCALABILITY,
+        'num_agents': 'polynomial', 
+        'coordination_complexity': 'exponential',
+        'overall': 'exponential'
+    }),
+    SDMProblemType.CAPACITY_ESTIMATION: MappingProxyType({
+        **_DEFAULT_SCALABILITY,
+        'vector_dimension': 'exponential',
+        'sparsity_level': 'exponential', 
+        'overall': 'double_exponential'
+    }),
+})
+
+_NO_APPROXIMATION = MappingProxyType({
+    'available': False,
+    'approximation_ratio': None,
+    'algorithm_type': None,
+    'time_complexity': None
+})
+
+_APPROXIMATION_TABLE = MappingProxyType({
+    SDMProblemType.OPTIMAL_RADIUS: MappingProxyType({
+        'available': True,
+        'approximation_ratio': '1.5',
+        'algorithm_type': 'greedy_search',
+        'time_complexity': 'O(n²)'
+    }),
+    SDMProblemType.INTERFERENCE_MINIMIZATION: MappingProxyType({
+        'available': True,
+        'approximation_ratio': '2.0',
+        'algorithm_type': 'graph_coloring_approximation',
+        'time_complexity': 'O(n log n)'
+    }),
+    SDMProblemType.SWARM_COORDINATION: MappingProxyType({
+        'available': True,
+        'approximation_ratio': 'FPTAS',
+        'algorithm_type': 'distributed_consensus',
+        'time_complexity': 'O(n³)'
+    }),
+    SDMProblemType.CAPACITY_ESTIMATION: MappingProxyType({
+        'available': True,
+        'approximation_ratio': '1.1',
+        'algorithm_type': 'sampling_based',
+        'time_complexity': 'O(n² log n)'
+    }),
+})
+
+# Problem-specific overrides applied on top of the size-based recommendation
+_RECOMMENDATION_OVERRIDES = MappingProxyType({
+    SDMProblemType.SWARM_COORDINATION: MappingProxyType({
+        'parallelization': 'distributed',
+        'primary_approach': 'consensus_algorithm'
+    }),
+    SDMProblemType.CAPACITY_ESTIMATION: MappingProxyType({
+        'primary_approach': 'sampling_method',
+        'fallback_approach': 'monte_carlo'
+    }),
+})
+
 class ComplexityAnalyzer:
     """Analyze computational complexity of SDM problems"""
     
+    # Known complexity classifications, built once and shared by all instances
+    complexity_map = MappingProxyType({
+        SDMProblemType.HAMMING_DISTANCE: ComplexityClass.P,
+        SDMProblemType.PATTERN_RETRIEVAL: ComplexityClass.P,
+        SDMProblemType.OPTIMAL_RADIUS: ComplexityClass.NP,
+        SDMProblemType.CAPACITY_ESTIMATION: ComplexityClass.SIGMA_2P,
+        SDMProblemType.INTERFERENCE_MINIMIZATION: ComplexityClass.NP,
+        SDMProblemType.SWARM_COORDINATION: ComplexityClass.PI_2P,
+        SDMProblemType.PATTERN_OPTIMIZATION: ComplexityClass.DELTA_2P,
+        SDMProblemType.MEMORY_ALLOCATION: ComplexityClass.NP
+    })
+    
     def __init__(self):
-        self.complexity_map = self._initialize_complexity_map()
         self.problem_characteristics = {}
-        
-    def _initialize_complexity_map(self) -> Dict[SDMProblemType, ComplexityClass]:
-        """Initialize known complexity classifications"""
-        return {
-            SDMProblemType.HAMMING_DISTANCE: ComplexityClass.P,
-            SDMProblemType.PATTERN_RETRIEVAL: ComplexityClass.P,
-            SDMProblemType.OPTIMAL_RADIUS: ComplexityClass.NP,
-            SDMProblemType.CAPACITY_ESTIMATION: ComplexityClass.SIGMA_2P,
-            SDMProblemType.INTERFERENCE_MINIMIZATION: ComplexityClass.NP,
-            SDMProblemType.SWARM_COORDINATION: ComplexityClass.PI_2P,
-            SDMProblemType.PATTERN_OPTIMIZATION: ComplexityClass.DELTA_2P,
-            SDMProblemType.MEMORY_ALLOCATION: ComplexityClass.NP
-        }
     
     def analyze_problem_complexity(self, problem_type: str, 
                                  problem_params: Dict[str, Any]) -> Dict[str, Any]:
@@ -100,80 +180,11 @@ class ComplexityAnalyzer:
     def _analyze_scalability(self, problem_type: SDMProblemType, 
                            params: Dict[str, Any]) -> Dict[str, str]:
         """Analyze how the problem scales with input size"""
-        
-        scalability = {
-            'vector_dimension': 'linear',
-            'num_locations': 'linear', 
-            'num_patterns': 'linear',
-            'overall': 'polynomial'
-        }
-        
-        if problem_type == SDMProblemType.HAMMING_DISTANCE:
-            scalability.update({
-                'vector_dimension': 'linear',
-                'overall': 'linear'
-            })
-        elif problem_type == SDMProblemType.OPTIMAL_RADIUS:
-            scalability.update({
-                'vector_dimension': 'exponential',
-                'num_patterns': 'exponential',
-                'overall': 'exponential'
-            })
-        elif problem_type == SDMProblemType.SWARM_COORDINATION:
-            scalability.update({
-                'num_agents': 'polynomial', 
-                'coordination_complexity': 'exponential',
-                'overall': 'exponential'
-            })
-        elif problem_type == SDMProblemType.CAPACITY_ESTIMATION:
-            scalability.update({
-                'vector_dimension': 'exponential',
-                'sparsity_level': 'exponential', 
-                'overall': 'double_exponential'
-            })
-            
-        return scalability
+        return dict(_SCALABILITY_TABLE.get(problem_type, _DEFAULT_SCALABILITY))
     
     def _check_approximation_algorithms(self, problem_type: SDMProblemType) -> Dict[str, Any]:
         """Check availability of approximation algorithms"""
-        
-        approximation_info = {
-            'available': False,
-            'approximation_ratio': None,
-            'algorithm_type': None,
-            'time_complexity': None
-        }
-        
-        if problem_type == SDMProblemType.OPTIMAL_RADIUS:
-            approximation_info.update({
-                'available': True,
-                'approximation_ratio': '1.5',
-                'algorithm_type': 'greedy_search',
-                'time_complexity': 'O(n²)'
-            })
-        elif problem_type == SDMProblemType.INTERFERENCE_MINIMIZATION:
-            approximation_info.update({
-                'available': True,
-                'approximation_ratio': '2.0',
-                'algorithm_type': 'graph_coloring_approximation',
-                'time_complexity': 'O(n log n)'
-            })
-        elif problem_type == SDMProblemType.SWARM_COORDINATION:
-            approximation_info.update({
-                'available': True,
-                'approximation_ratio': 'FPTAS',
-                'algorithm_type': 'distributed_consensus',
-                'time_complexity': 'O(n³)'
-            })
-        elif problem_type == SDMProblemType.CAPACITY_ESTIMATION:
-            approximation_info.update({
-                'available': True,
-                'approximation_ratio': '1.1',
-                'algorithm_type': 'sampling_based',
-                'time_complexity': 'O(n² log n)'
-            })
-            
-        return approximation_info
+        return dict(_APPROXIMATION_TABLE.get(problem_type, _NO_APPROXIMATION))
     
     def _recommend_solution_approach(self, problem_type: SDMProblemType, 
                                    params: Dict[str, Any]) -> Dict[str, str]:
@@ -220,13 +231,7 @@ class ComplexityAnalyzer:
                 recommendations['hardware_requirements'] = 'high_performance'
         
         # Problem-specific recommendations
-        if problem_type == SDMProblemType.SWARM_COORDINATION:
-            recommendations['parallelization'] = 'distributed'
-            recommendations['primary_approach'] = 'consensus_algorithm'
-            
-        elif problem_type == SDMProblemType.CAPACITY_ESTIMATION:
-            recommendations['primary_approach'] = 'sampling_method'
-            recommendations['fallback_approach'] = 'monte_carlo'
+        recommendations.update(_RECOMMENDATION_OVERRIDES.get(problem_type, {}))
             
         return recommendations
     
@@ -285,6 +290,9 @@ class ComplexityAnalyzer:
             'analysis_notes': f'Unknown problem type: {problem_type}. Recommend empirical complexity analysis.'
         }
 
+# Shared analyzer used by the module-level helpers (it holds no per-call state)
+_DEFAULT_ANALYZER = ComplexityAnalyzer()
+
 # Main analysis function for external use
 def analyze_problem_complexity(problem_type: str, **kwargs) -> Dict[str, Any]:
     """
@@ -301,8 +309,7 @@ def analyze_problem_complexity(problem_type: str, **kwargs) -> Dict[str, Any]:
         >>> analyze_problem_complexity('optimal_radius', vector_dim=512, num_patterns=100)
         >>> analyze_problem_complexity('swarm_coordination', num_agents=10, coordination_depth=3)
     """
-    analyzer = ComplexityAnalyzer()
-    return analyzer.analyze_problem_complexity(problem_type, kwargs)
+    return _DEFAULT_ANALYZER.analyze_problem_complexity(problem_type, kwargs)
 
 def get_complexity_recommendations(problem_type: str, problem_size: int) -> Dict[str, str]:
     """
@@ -315,8 +322,6 @@ def get_complexity_recommendations(problem_type: str, problem_size: int) -> Dict
     Returns:
         Dictionary with solution recommendations
     """
-    analyzer = ComplexityAnalyzer()
-    
     # Basic parameters based on problem size
     if problem_size < 1000:
         params = {'vector_dim': 64, 'num_locations': 100}
@@ -325,7 +330,7 @@ def get_complexity_recommendations(problem_type: str, problem_size: int) -> Dict
     else:
         params = {'vector_dim': 1024, 'num_locations': 2000}
     
-    analysis = analyzer.analyze_problem_complexity(problem_type, params)
+    analysis = _DEFAULT_ANALYZER.analyze_problem_complexity(problem_type, params)
     return analysis['recommended_approach']
 
 # Utility functions for specific SDM operations
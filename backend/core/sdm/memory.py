@@ -1,9 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import sys
+from collections import deque
 from typing import Dict, List, Tuple, Optional
+from .utils import (pack_bits, unpack_bits, hamming_distances, bits_to_base64,
+                    get_array_module, to_numpy, indices_to_bits, num_words)
+from . import _kernels
+
 class SparseDistributedMemory:
-    def __init__(self, vector_dim=1024, num_locations=1000, access_radius=100):
+    def __init__(self, vector_dim=1024, num_locations=1000, access_radius=100, seed=None,
+                 device="cpu", debug=False, max_activations=None, max_history=1000,
+                 addresses=None):
         """
         Enhanced SDM with better sparsity control and analysis capabilities.
         
@@ -11,21 +18,94 @@ class SparseDistributedMemory:
             vector_dim: Dimensionality of binary vectors.
             num_locations: Number of hard memory locations.
             access_radius: Max Hamming distance to activate locations.
+            seed: Optional seed for the address generator (PCG64).
+            device: "cuda" keeps addresses and memory on the GPU via CuPy
+                    (falls back to NumPy when CuPy is not installed).
+            debug: Print activation diagnostics on every write.
+            max_activations: If set, reads use at most this many of the closest
+                             activated locations, bounding recall cost when the
+                             radius is loose.
+            max_history: Number of most recent write/read statistics entries
+                         kept (None keeps all of them).
+            addresses: Optional pre-packed uint64 address table of shape
+                       (num_locations, ceil(vector_dim / 64)), e.g. a row slice
+                       of a larger table from `generate_addresses`; random
+                       addresses are generated when None.
         """
         self.vector_dim = vector_dim
         self.num_locations = num_locations
         self.access_radius = access_radius
+        self.debug = debug
+        self.max_activations = max_activations
+        self._rng = np.random.default_rng(seed)
+        # Addresses, memory and access counts live on this device (see `xp`)
+        self.device = "cuda" if get_array_module(device) is not np else "cpu"
 
-        # Initialize random fixed hard locations (addresses)
-        self.addresses = self._generate_addresses(target_sparsity=0.03)
-        # Memory locations store integer counts per bit (for weighted sums)
-        self.memory = np.zeros((num_locations, vector_dim), dtype=int)
+        # Initialize random fixed hard locations (addresses), bit-packed into uint64 words
+        if addresses is None:
+            addresses = self._generate_addresses(target_sparsity=0.03)
+        elif addresses.shape != (num_locations, num_words(vector_dim)):
+            raise ValueError(f"addresses must have shape ({num_locations}, {num_words(vector_dim)}), "
+                             f"got {addresses.shape}")
+        self.addresses = self.xp.asarray(addresses)
+        # Memory locations store integer counts per bit (for weighted sums).
+        # Each write moves a cell by +/-strength, so a cell never exceeds the
+        # total strength written so far; int16 covers that for realistic
+        # reinforcement and the array is widened to int32 if it could overflow.
+        self.memory = self.xp.zeros((num_locations, vector_dim), dtype=np.int16)
+        self._strength_written = 0
         # Track access counts for each location
-        self.access_counts = np.zeros(num_locations, dtype=int)
+        self.access_counts = self.xp.zeros(num_locations, dtype=int)
+        # Use the fused Numba kernels for write/read when numba is installed (host only)
+        self.use_jit = _kernels.NUMBA_AVAILABLE and self.device == "cpu"
+        # Activation of the most recent write, reused when the same pattern is
+        # reinforced again at the same radius and strength
+        self._last_write_key = None
+        self._last_write = None
+        # Unpacked float32 addresses and their row sums, built lazily for the batch GEMM path
+        self._address_bits = None
+        self._address_ones = None
         
-        # Statistics tracking
-        self.write_stats = []
-        self.read_stats = []
+        # Statistics tracking, bounded so long-running agents don't grow without limit
+        self.write_stats = deque(maxlen=max_history)
+        self.read_stats = deque(maxlen=max_history)
+
+    @property
+    def xp(self):
+        """Array module for this memory's device (cupy on "cuda", numpy otherwise)"""
+        return get_array_module(self.device)
+
+    def to_device(self, device):
+        """
+        Move addresses, memory and access counts to `device` ("cpu" or "cuda").
+
+        Keeping the address table resident on the GPU lets large batch scans
+        (read_batch / write_batch) run as device GEMMs. Falls back to "cpu"
+        when CuPy is not installed.
+        """
+        self.device = "cuda" if get_array_module(device) is not np else "cpu"
+        move = self.xp.asarray if self.device == "cuda" else to_numpy
+        self.addresses = move(self.addresses)
+        self.memory = move(self.memory)
+        self.access_counts = move(self.access_counts)
+        self.use_jit = _kernels.NUMBA_AVAILABLE and self.device == "cpu"
+        # Cached device arrays are rebuilt on the new device when next needed
+        self._last_write_key = None
+        self._last_write = None
+        self._address_bits = None
+        self._address_ones = None
+        return self
+
+    def clear(self):
+        """Erase everything written (counters, access counts, statistics); addresses are kept"""
+        self.memory = self.xp.zeros((self.num_locations, self.vector_dim), dtype=np.int16)
+        self._strength_written = 0
+        self.access_counts = self.xp.zeros(self.num_locations, dtype=int)
+        self._last_write_key = None
+        self._last_write = None
+        self.write_stats.clear()
+        self.read_stats.clear()
+        return self
 
     def _generate_addresses(self, target_sparsity=0.03):
         """
@@ -33,96 +113,190 @@ class SparseDistributedMemory:
         
         Args:
             target_sparsity: Fraction of bits that should be 1 (0.02-0.05 optimal)
+        Returns:
+            uint64 array of shape (num_locations, ceil(vector_dim / 64))
+        """
+        return generate_addresses(self.vector_dim, self.num_locations, target_sparsity, self._rng)
+
+    def address_distances(self, vector):
+        """
+        Hamming distance from a binary vector to every hard location.
+
+        Uses XOR + popcount over the packed address table, so the cost is
+        num_locations * vector_dim / 64 word operations with no Python loop.
         """
-        # Dense implementation for high sparsity (backward compatibility)
-        if target_sparsity >= 0.1:
-            return np.random.randint(2, size=(self.num_locations, self.vector_dim))
-        
-        #Ssparse implementation for low sparsity (optimal)
-        addresses = np.zeros((self.num_locations, self.vector_dim), dtype=int)
-        for i in range(self.num_locations):
-            num_ones = int(self.vector_dim * target_sparsity)
-            if num_ones > 0:  # Avoiding empty vectors
-                indices = np.random.choice(self.vector_dim, num_ones, replace=False)
-                addresses[i, indices] = 1
-        return addresses
-
-    def _hamming_distance(self, v1, v2):
-        """Compute Hamming distance between two binary vectors"""
-        return np.sum(v1 != v2)
-
-    def write(self, input_vector, strength=1):
+        packed = self.xp.asarray(pack_bits(vector))
+        if self.use_jit:
+            # One-word addresses skip the word loop (the unrolled form only pays
+            # off at this width; wider tables keep the generic loop)
+            if self.addresses.shape[1] == 1:
+                return _kernels.hamming_scan_single_word(self.addresses, packed)
+            return _kernels.hamming_scan(self.addresses, packed)
+        return hamming_distances(self.addresses, packed)
+
+    def write(self, input_vector, strength=1, dists=None):
         """
         Store input_vector into all locations within access_radius
         
         Args:
             input_vector: binary numpy array (0/1)
             strength: how much to reinforce this pattern (default=1)
+            dists: optional precomputed Hamming distances to every location
+                   (skips the address scan)
         """
-        activated_locations = []
+        # FIXED: Your current write operation has issues
+        # Original: self.memory[i] += np.where(input_vector == 1, 2, -1)
+        # Problem: This can make memory go negative and creates bias
         
-        # DEBUG: Add this to diagnose the issue
-        min_distance = float('inf')
-        max_distance = 0
+        # Better approach: Store the actual pattern with reinforcement.
+        # The delta is built once and broadcast over every activated row.
+        self._strength_written += abs(strength)
+        if self._strength_written > np.iinfo(self.memory.dtype).max:
+            self.memory = self.memory.astype(np.int32)
+        packed_input = pack_bits(input_vector)
+        # The address scan uses the nonzero bits but the delta only counts exact
+        # ones, so both go into the key (they differ for non-binary inputs)
+        ones = np.asarray(input_vector) == 1
+        write_key = (packed_input.tobytes(), pack_bits(ones).tobytes(), self.access_radius, strength)
+        packed_input = self.xp.asarray(packed_input)
         
-        for i, addr in enumerate(self.addresses):
-            dist = self._hamming_distance(input_vector, addr)
-            min_distance = min(min_distance, dist)
-            max_distance = max(max_distance, dist)
-            
-            if dist <= self.access_radius:
-                activated_locations.append(i)
-                self.access_counts[i] += 1
-                
-                # FIXED: Your current write operation has issues
-                # Original: self.memory[i] += np.where(input_vector == 1, 2, -1)
-                # Problem: This can make memory go negative and creates bias
-                
-                # Better approach: Store the actual pattern with reinforcement
-                self.memory[i] += np.where(input_vector == 1, strength, -strength)
-        
-        # DEBUG: Print diagnostic info
-        print(f"DEBUG: access_radius={self.access_radius}, min_dist={min_distance}, max_dist={max_distance}, activated={len(activated_locations)}")
+        if write_key == self._last_write_key:
+            # Reinforcing the previous pattern: skip the address scan
+            dists, mask, delta = self._last_write
+            self.memory[mask] += delta
+            self.access_counts[mask] += 1
+        else:
+            delta = self.xp.asarray(np.where(ones, strength, -strength).astype(self.memory.dtype))
+            if self.use_jit and dists is None:
+                dists = _kernels.sdm_write(self.addresses, self.memory, packed_input,
+                                           delta, self.access_radius, self.access_counts)
+                mask = dists <= self.access_radius
+            else:
+                if dists is None:
+                    dists = hamming_distances(self.addresses, packed_input)
+                mask = dists <= self.access_radius
+                self.memory[mask] += delta
+                self.access_counts[mask] += 1
+            self._last_write_key = write_key
+            self._last_write = (dists, mask, delta)
+        num_activated = int(self.xp.count_nonzero(mask))
+        
+        if self.debug:
+            # DEBUG: Print diagnostic info
+            min_distance = dists.min()
+            max_distance = dists.max()
+            print(f"DEBUG: access_radius={self.access_radius}, min_dist={min_distance}, max_dist={max_distance}, activated={num_activated}")
         
         # Track statistics
         self.write_stats.append({
-            'activated_locations': len(activated_locations),
-            'activation_rate': len(activated_locations) / self.num_locations,
+            'activated_locations': num_activated,
+            'activation_rate': num_activated / self.num_locations,
             'pattern_sparsity': np.mean(input_vector)
         })
         
-        return len(activated_locations)
-    def read(self, query_vector):
+        return num_activated
+
+    def write_then_read(self, input_vector, strength=1):
+        """
+        write() followed by read() of the same vector.
+
+        The read reuses the distances found by the write, so the address table
+        is scanned once. Returns (output_vector, confidence) like read().
+        """
+        self.write(input_vector, strength)
+        dists = self._last_write[0]
+        return self.read(input_vector, dists=dists)
+
+    def write_sparse(self, indices, strength=1):
+        """write() for a pattern given as the int array of its active bit indices"""
+        return self.write(indices_to_bits(indices, self.vector_dim), strength)
+
+    def write_repeated(self, input_vector, times, strength=1, dists=None):
+        """
+        Store input_vector `times` times; equivalent to calling write() in a loop.
+
+        The activated set is found once and the accumulated delta is applied
+        in a single add, so k reinforcement cycles cost one address scan.
+        
+        Args:
+            input_vector: binary numpy array (0/1)
+            times: number of reinforcement cycles
+            strength: how much to reinforce per cycle (default=1)
+            dists: optional precomputed Hamming distances to every location
+        """
+        input_vector = np.asarray(input_vector)
+        self._strength_written += abs(strength) * times
+        if self._strength_written > np.iinfo(self.memory.dtype).max:
+            self.memory = self.memory.astype(np.int32)
+        if dists is None:
+            dists = self.address_distances(input_vector)
+        mask = dists <= self.access_radius
+        total_strength = strength * times
+        delta = np.where(input_vector == 1, total_strength, -total_strength).astype(self.memory.dtype)
+        self.memory[mask] += self.xp.asarray(delta)
+        self.access_counts[mask] += times
+        num_activated = int(self.xp.count_nonzero(mask))
+        
+        if self.debug:
+            print(f"DEBUG: access_radius={self.access_radius}, min_dist={dists.min()}, max_dist={dists.max()}, activated={num_activated} x{times}")
+        
+        # One statistics entry per cycle, as the write() loop would record
+        pattern_sparsity = np.mean(input_vector)
+        self.write_stats.extend({
+            'activated_locations': num_activated,
+            'activation_rate': num_activated / self.num_locations,
+            'pattern_sparsity': pattern_sparsity
+        } for _ in range(times))
+        
+        return num_activated
+
+    def read(self, query_vector, dists=None):
         """
         Recall from memory by weighted sum of nearby locations.
         
         Args:
             query_vector: binary numpy array (0/1)
+            dists: optional precomputed Hamming distances to every location
+                   (skips the address scan)
         Returns:
             output_vector: binary numpy array (0/1)
             confidence: measure of retrieval confidence
         """
-        activated_idxs = []
-        distances = []
-        
-        for i, addr in enumerate(self.addresses):
-            dist = self._hamming_distance(query_vector, addr)
-            if dist <= self.access_radius:
-                activated_idxs.append(i)
-                distances.append(dist)
+        total = self.xp.zeros(self.vector_dim)
+        # The fused kernel weights every location in the radius, so it is only
+        # usable when the activation count is not capped
+        fused = self.use_jit and self.max_activations is None and dists is None
+        if fused:
+            # Fused scan + weighted accumulation in a single pass
+            dists = _kernels.sdm_read(self.addresses, self.memory, pack_bits(query_vector),
+                                      self.access_radius, total, _kernels.get_num_threads())
+            mask = dists <= self.access_radius
+        else:
+            if dists is None:
+                dists = self.address_distances(query_vector)
+            mask = dists <= self.access_radius
+        activated = self.xp.flatnonzero(mask)
+        if self.max_activations is not None and len(activated) > self.max_activations:
+            # Keep the closest max_activations locations (O(n) partial selection)
+            nearest = self.xp.argpartition(dists[activated], self.max_activations - 1)
+            activated = activated[nearest[:self.max_activations]]
+        num_activated = len(activated)
+        distances = dists[activated]
 
-        if not activated_idxs:
+        if num_activated == 0:
             # No nearby locations found; return empty
             return np.zeros(self.vector_dim, dtype=int), 0.0
 
-        # Weight by inverse distance (closer = higher weight)
-        weights = np.array([1.0 / (1.0 + d) for d in distances])
-        weights = weights / np.sum(weights)  # Normalize
-        
-        # Weighted sum of activated memory locations
-        total = np.zeros(self.vector_dim)
-        for idx, weight in zip(activated_idxs, weights):
-            total += weight * self.memory[idx]
+        if not fused:
+            # Weight by inverse distance (closer = higher weight)
+            weights = 1.0 / (1.0 + distances)
+            weights = weights / np.sum(weights)  # Normalize
+            
+            # Weighted sum of activated memory locations as one BLAS GEMV. take()
+            # gathers just the activated rows; a GEMV over the whole matrix would
+            # skip the gather but has to cast every int16 row to float first.
+            total = weights @ self.memory.take(activated, axis=0)
+        total, distances = to_numpy(total), to_numpy(distances)
         
         # Threshold to get binary output
         output_vector = (total > 0).astype(int)
@@ -132,36 +306,172 @@ class SparseDistributedMemory:
         
         # Track statistics
         self.read_stats.append({
-            'activated_locations': len(activated_idxs),
-            'activation_rate': len(activated_idxs) / self.num_locations,
+            'activated_locations': num_activated,
+            'activation_rate': num_activated / self.num_locations,
             'confidence': confidence,
-            'avg_distance': np.mean(distances) if distances else float('inf')
+            'avg_distance': np.mean(distances) if len(distances) else float('inf')
         })
         
         return output_vector, confidence
     
+    def read_sparse(self, indices):
+        """read() for a query given as the int array of its active bit indices"""
+        return self.read(indices_to_bits(indices, self.vector_dim))
+
+    def batch_address_distances(self, vectors):
+        """
+        Hamming distances from each row of `vectors` (B, D) to every hard location.
+
+        With Numba the table comes from a parallel packed XOR + popcount scan.
+        Otherwise, since |a - q| = |a| + |q| - 2 a.q for {0,1} vectors, it is a
+        single float32 GEMM against the unpacked address bits.
+        """
+        if self.use_jit:
+            return _kernels.hamming_scan_batch(self.addresses, pack_bits(vectors))
+        xp = self.xp
+        if self._address_bits is None:
+            address_bits = unpack_bits(to_numpy(self.addresses), self.vector_dim).astype(np.float32)
+            self._address_bits = xp.asarray(address_bits)
+            self._address_ones = self._address_bits.sum(axis=1)
+        queries = xp.asarray((np.asarray(vectors) != 0).astype(np.float32))
+        dots = queries @ self._address_bits.T
+        dists = self._address_ones[None, :] + queries.sum(axis=1, keepdims=True) - 2 * dots
+        return dists.astype(xp.int64)
+
+    def write_batch(self, input_vectors, strength=1, dists=None):
+        """
+        Store every row of input_vectors; equivalent to calling write() on each row.
+        
+        Args:
+            input_vectors: binary numpy array (0/1) of shape (B, vector_dim)
+            strength: how much to reinforce each pattern (default=1)
+            dists: optional precomputed (B, num_locations) distance table
+        Returns:
+            number of activated locations per input, shape (B,)
+        """
+        input_vectors = np.asarray(input_vectors)
+        if dists is None:
+            dists = self.batch_address_distances(input_vectors)
+        masks = dists <= self.access_radius
+        
+        self._strength_written += abs(strength) * len(input_vectors)
+        if self._strength_written > np.iinfo(self.memory.dtype).max:
+            self.memory = self.memory.astype(np.int32)
+        deltas = self.xp.asarray(np.where(input_vectors == 1, strength, -strength).astype(np.float32))
+        # (N, B) @ (B, D): every activated row receives the sum of its inputs' deltas
+        self.memory += (masks.T.astype(np.float32) @ deltas).astype(self.memory.dtype)
+        self.access_counts += masks.sum(axis=0)
+        
+        num_activated = to_numpy(masks.sum(axis=1))
+        for count, input_vector in zip(num_activated, input_vectors):
+            self.write_stats.append({
+                'activated_locations': int(count),
+                'activation_rate': count / self.num_locations,
+                'pattern_sparsity': np.mean(input_vector)
+            })
+        return num_activated
+
+    def read_batch(self, query_vectors, dists=None):
+        """
+        Recall every row of query_vectors; equivalent to calling read() on each row.
+        
+        Args:
+            query_vectors: binary numpy array (0/1) of shape (B, vector_dim)
+            dists: optional precomputed (B, num_locations) distance table
+        Returns:
+            output_vectors: binary numpy array (0/1) of shape (B, vector_dim)
+            confidences: retrieval confidence per query, shape (B,)
+        """
+        xp = self.xp
+        if dists is None:
+            dists = self.batch_address_distances(query_vectors)
+        masks = dists <= self.access_radius
+        if self.max_activations is not None and self.max_activations < self.num_locations:
+            # Per query, keep only the closest max_activations locations
+            nearest = xp.argpartition(dists, self.max_activations - 1, axis=1)[:, :self.max_activations]
+            closest = xp.zeros_like(masks)
+            closest[xp.arange(len(masks))[:, None], nearest] = True
+            masks &= closest
+        
+        # Inverse-distance weights, zero outside the radius, normalized per query
+        weights = xp.where(masks, 1.0 / (1.0 + dists), 0.0)
+        weight_sums = weights.sum(axis=1, keepdims=True)
+        weights = weights / xp.where(weight_sums > 0, weight_sums, 1.0)
+        
+        # (B, N) @ (N, D): all weighted recalls in one GEMM
+        totals = to_numpy(weights @ self.memory)
+        dists, masks = to_numpy(dists), to_numpy(masks)
+        num_activated = masks.sum(axis=1)
+        output_vectors = (totals > 0).astype(int)
+        confidences = np.abs(totals).max(axis=1)
+        
+        for count, row_dists, row_mask, confidence in zip(num_activated, dists, masks, confidences):
+            if count == 0:
+                continue
+            self.read_stats.append({
+                'activated_locations': int(count),
+                'activation_rate': count / self.num_locations,
+                'confidence': confidence,
+                'avg_distance': np.mean(row_dists[row_mask])
+            })
+        return output_vectors, confidences
+    
     def get_memory_statistics(self):
         """Get comprehensive statistics about memory state"""
+        access_counts = to_numpy(self.access_counts)
         return {
-            'memory_utilization': np.mean(self.access_counts > 0),
-            'avg_access_count': np.mean(self.access_counts),
-            'max_access_count': np.max(self.access_counts),
-            'memory_magnitude': np.mean(np.abs(self.memory)),
-            'write_stats': self.write_stats,
-            'read_stats': self.read_stats
+            'memory_utilization': np.mean(access_counts > 0),
+            'avg_access_count': np.mean(access_counts),
+            'max_access_count': np.max(access_counts),
+            'memory_magnitude': float(self.xp.mean(self.xp.abs(self.memory))),
+            'write_stats': list(self.write_stats),
+            'read_stats': list(self.read_stats)
         }
 
-def generate_sparse_vector(dim: int, sparsity: float = 0.05) -> np.ndarray:
+def generate_addresses(vector_dim, num_locations, target_sparsity=0.03, rng=None):
+    """
+    Random packed SDM addresses with specified sparsity.
+
+    Rows are drawn independently, so the first K rows of a table are a valid
+    address table for a K-location memory (see the `addresses` argument of
+    SparseDistributedMemory).
+
+    Args:
+        vector_dim: Bits per address
+        num_locations: Number of address rows
+        target_sparsity: Fraction of bits that should be 1 (0.02-0.05 optimal)
+        rng: numpy Generator (a fresh default_rng() when None)
+    Returns:
+        uint64 array of shape (num_locations, ceil(vector_dim / 64))
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    # Dense implementation for high sparsity (backward compatibility)
+    if target_sparsity >= 0.1:
+        return pack_bits(rng.integers(0, 2, size=(num_locations, vector_dim), dtype=np.uint8))
+    
+    #Ssparse implementation for low sparsity (optimal)
+    # Every row gets exactly num_ones bits: shuffle a template row independently per row
+    num_ones = int(vector_dim * target_sparsity)
+    template = np.zeros(vector_dim, dtype=np.uint8)
+    template[:num_ones] = 1
+    addresses = rng.permuted(np.tile(template, (num_locations, 1)), axis=1)
+    return pack_bits(addresses)
+
+def generate_sparse_vector(dim: int, sparsity: float = 0.05, rng=None) -> np.ndarray:
     """
     Generate properly sparse binary vector (unlike your current dense ones)
     
     Args:
         dim: vector dimension
         sparsity: fraction of bits that should be 1 (0.02-0.05 is optimal)
+        rng: numpy Generator (a fresh default_rng() when None)
     """
+    if rng is None:
+        rng = np.random.default_rng()
     vector = np.zeros(dim, dtype=int)
     num_ones = int(dim * sparsity)
-    indices = np.random.choice(dim, num_ones, replace=False)
+    indices = rng.choice(dim, num_ones, replace=False)
     vector[indices] = 1
     return vector
 
@@ -189,16 +499,14 @@ def run_reinforcement_analysis(vector_dim=128, num_locations=1000, access_radius
         
         # Test dense vector (your current approach)
         sdm_dense = SparseDistributedMemory(vector_dim, num_locations, access_radius)
-        for _ in range(reinforce):
-            sdm_dense.write(dense_vector)
+        sdm_dense.write_repeated(dense_vector, reinforce)
         
         output_dense, conf_dense = sdm_dense.read(dense_vector)
         match_ratio_dense = np.mean(dense_vector == output_dense)
         
         # Test sparse vector (better approach)
         sdm_sparse = SparseDistributedMemory(vector_dim, num_locations, access_radius)
-        for _ in range(reinforce):
-            sdm_sparse.write(sparse_vector)
+        sdm_sparse.write_repeated(sparse_vector, reinforce)
         
         output_sparse, conf_sparse = sdm_sparse.read(sparse_vector)
         match_ratio_sparse = np.mean(sparse_vector == output_sparse)
@@ -250,42 +558,61 @@ def plot_reinforcement_effects(results):
     plt.show()
 
 def run_enhanced_sdm_test(vector_dim=32, num_locations=3000, access_radius=18, 
-                       reinforce=30, use_sparse_encoding=True, target_sparsity=0.03):
+                       reinforce=30, use_sparse_encoding=True, target_sparsity=0.03,
+                       include_vectors=False, seed=None, input_vector=None):
     """
     Enhanced version of your test function with better analysis
+
+    The input and recalled vectors are only added to the result when
+    include_vectors is True. `seed` seeds one PCG64 generator that draws the
+    addresses and the input, making the run reproducible. A binary
+    `input_vector` replaces the drawn input (e.g. one vector shared by every
+    test of a dimension).
     """
+    rng = np.random.default_rng(seed)
     sdm = SparseDistributedMemory(vector_dim=vector_dim, 
     num_locations=num_locations, 
-    access_radius=access_radius)
+    access_radius=access_radius,
+    seed=rng)
     
-    # Generate input vector
+    input_vec = _test_input(vector_dim, use_sparse_encoding, target_sparsity, rng, input_vector)
+
+    # Write with reinforcement
+    print(f"Writing pattern {reinforce} times...")
+    activated = sdm.write_repeated(input_vec, reinforce)
+    print(f"First write activated {activated}/{num_locations} locations ({100*activated/num_locations:.1f}%)")
+    
+    # Read back
+    output_vec, confidence = sdm.read(input_vec)
+    return _memory_test_result(sdm, input_vec, output_vec, confidence, reinforce, include_vectors)
+
+def _test_input(vector_dim, use_sparse_encoding, target_sparsity, rng, input_vector=None):
+    """Input vector of a memory test: `input_vector` if given, else drawn from `rng` in one bulk call"""
+    if input_vector is not None:
+        if len(input_vector) != vector_dim:
+            raise ValueError(f"input_vector has {len(input_vector)} bits, expected {vector_dim}")
+        return input_vector
     if use_sparse_encoding:
         # Use the target sparsity for sparse vectors
         actual_sparsity = target_sparsity if target_sparsity < 0.1 else 0.03
-        input_vec = generate_sparse_vector(vector_dim, sparsity=actual_sparsity)
+        input_vec = generate_sparse_vector(vector_dim, sparsity=actual_sparsity, rng=rng)
         print(f"Using sparse encoding ({actual_sparsity*100:.1f}%): {np.sum(input_vec)}/{vector_dim} bits active")
     else:
-        input_vec = np.random.randint(2, size=vector_dim)
+        input_vec = rng.integers(0, 2, size=vector_dim)
         print(f"Using dense encoding: {np.sum(input_vec)}/{vector_dim} bits active ({100*np.mean(input_vec):.1f}%)")
+    return input_vec
 
-    # Write with reinforcement
-    print(f"Writing pattern {reinforce} times...")
-    for i in range(reinforce):
-        activated = sdm.write(input_vec)
-        if i == 0:
-            print(f"First write activated {activated}/{num_locations} locations ({100*activated/num_locations:.1f}%)")
-    
-    # Read back
-    output_vec, confidence = sdm.read(input_vec)
+def _memory_test_result(sdm, input_vec, output_vec, confidence, reinforce, include_vectors):
+    """Summary, statistics and (optionally) vectors of one write/read memory test"""
     match_ratio = float(np.mean(input_vec == output_vec))
     
     # Get detailed statistics
     stats = sdm.get_memory_statistics()
     
     summary = {
-        "vector_dim": vector_dim,
-        "num_locations": num_locations,
-        "access_radius": access_radius,
+        "vector_dim": sdm.vector_dim,
+        "num_locations": sdm.num_locations,
+        "access_radius": sdm.access_radius,
         "reinforce": reinforce,
         "match_ratio": match_ratio,
         "confidence": confidence,
@@ -298,20 +625,62 @@ def run_enhanced_sdm_test(vector_dim=32, num_locations=3000, access_radius=18,
         "memory_utilization": stats['memory_utilization']
     }
 
-    return {
+    result = {
         "summary": summary,
-        "input_vector": input_vec.tolist(),
-        "recalled_vector": output_vec.tolist(),
         "statistics": stats
     }
+    if include_vectors:
+        # Vectors are base64 of np.packbits bytes (see utils.bits_to_base64)
+        result["input_vector"] = bits_to_base64(input_vec)
+        result["recalled_vector"] = bits_to_base64(output_vec)
+    return result
+
+def run_sdm_memory_test_sweep(vector_dim=32, num_locations=3000, radii=(18,), reinforce=30,
+                              use_sparse_encoding=True, target_sparsity=0.03,
+                              include_vectors=False, addresses=None, seed=None,
+                              input_vector=None):
+    """
+    run_enhanced_sdm_test for several access radii over one memory and input.
+
+    Addresses are generated and the input-to-address distances computed once;
+    each radius then only re-thresholds those distances for its write and
+    read, starting from an empty memory. Returns one result per radius, in
+    the order given. `addresses` optionally supplies a pre-packed address
+    table (see SparseDistributedMemory); `seed` and `input_vector` are as in
+    run_enhanced_sdm_test.
+    """
+    rng = np.random.default_rng(seed)
+    sdm = SparseDistributedMemory(vector_dim=vector_dim, num_locations=num_locations,
+                                  access_radius=radii[0] if len(radii) else 0,
+                                  seed=rng, addresses=addresses)
+    
+    input_vec = _test_input(vector_dim, use_sparse_encoding, target_sparsity, rng, input_vector)
+    
+    dists = sdm.address_distances(input_vec)
+    
+    results = []
+    for access_radius in radii:
+        sdm.clear()
+        sdm.access_radius = access_radius
+        activated = sdm.write_repeated(input_vec, reinforce, dists=dists)
+        print(f"r={access_radius}: {reinforce} writes activated {activated}/{num_locations} locations "
+              f"({100*activated/num_locations:.1f}%)")
+        output_vec, confidence = sdm.read(input_vec, dists=dists)
+        results.append(_memory_test_result(sdm, input_vec, output_vec, confidence,
+                                           reinforce, include_vectors))
+    return results
 
 def run_sdm_memory_test(vector_dim=32, num_locations=3000, access_radius=18, 
-                       reinforce=30, use_sparse_encoding=True, target_sparsity=0.03):
+                       reinforce=30, use_sparse_encoding=True, target_sparsity=0.03,
+                       include_vectors=False, seed=None, input_vector=None):
 
     result = run_enhanced_sdm_test(
         vector_dim, num_locations, access_radius, reinforce, 
         use_sparse_encoding=use_sparse_encoding,
-        target_sparsity=target_sparsity 
+        target_sparsity=target_sparsity,
+        include_vectors=include_vectors,
+        seed=seed,
+        input_vector=input_vector
     )
     return result
 
@@ -1,5 +1,7 @@
 # backend/core/sdm/optimization/radius_optimizer.py
 
+import os
+import multiprocessing
 import numpy as np
 from typing import List, Dict, Tuple, Optional, Callable
 from enum import Enum
@@ -23,13 +25,51 @@ class PerformanceMetric(Enum):
     RETRIEVAL_ACCURACY = "retrieval_accuracy"
     COMPUTATIONAL_EFFICIENCY = "computational_efficiency"
 
+# Metrics that only read the agent's address table; every other metric writes
+# patterns into the agent, so those evaluations have to run one at a time
+_READ_ONLY_METRICS = frozenset({PerformanceMetric.ACTIVATION_RATE})
+
+
+def _can_use_threads(agents) -> bool:
+    """
+    Thread pools only pay off on the NumPy/BLAS path. Agents running the Numba
+    kernels already use every core, and parallel kernels launched from any
+    non-main thread can hang Numba's threading layer at interpreter shutdown.
+    """
+    return not any(getattr(agent, 'use_jit', False) for agent in agents)
+
+# Per-process (optimizer, agent, patterns, metric) of the brute-force scoring pool
+_score_worker_state = None
+
+def _init_score_worker(sdm_agent, patterns: np.ndarray, metric: PerformanceMetric):
+    """Pool initializer: one optimizer per worker, so its distance table is built once"""
+    global _score_worker_state
+    _score_worker_state = (RadiusOptimizer(), sdm_agent, patterns, metric)
+
+def _score_radius_worker(radius: int) -> float:
+    """Pool worker: score one radius against this process's copy of the agent"""
+    optimizer, sdm_agent, patterns, metric = _score_worker_state
+    return optimizer._score_radius(sdm_agent, patterns, radius, metric)
+
 class RadiusOptimizer:
     """Optimize access radius across single or multiple SDM agents"""
     
-    def __init__(self, strategy: OptimizationStrategy = OptimizationStrategy.GENETIC_ALGORITHM):
+    def __init__(self, strategy: OptimizationStrategy = OptimizationStrategy.GENETIC_ALGORITHM,
+                 use_multiprocessing: bool = False,
+                 use_precomputed_distances: bool = True):
         self.strategy = strategy
+        # Score brute-force radii in a process pool (each worker gets a copy of the
+        # agent, so only read-only metrics qualify; see _READ_ONLY_METRICS)
+        self.use_multiprocessing = use_multiprocessing
+        # Compute the pattern x address distance table once per agent instead of
+        # rescanning the addresses on every write/read of every candidate radius
+        self.use_precomputed_distances = use_precomputed_distances
         self.optimization_history = []
         self.best_parameters = {}
+        # Scores keyed by (id(agent), radius, metric); valid for one pattern set
+        self._eval_cache: Dict[Tuple[int, int, PerformanceMetric], float] = {}
+        # (P, N) pattern-to-address distances keyed by id(agent); same lifetime
+        self._distance_cache: Dict[int, np.ndarray] = {}
         
     def optimize_single_agent(self, sdm_agent, patterns: List[np.ndarray], 
                             metric: PerformanceMetric = PerformanceMetric.MATCH_RATIO,
@@ -39,7 +79,7 @@ class RadiusOptimizer:
         
         Args:
             sdm_agent: SDM agent to optimize
-            patterns: List of test patterns
+            patterns: List of binary test patterns (stacked into a (P, D) uint8 array)
             metric: Performance metric to optimize
             radius_range: (min_radius, max_radius) search range
             
@@ -48,6 +88,11 @@ class RadiusOptimizer:
         """
         if radius_range is None:
             radius_range = (1, sdm_agent.vector_dim // 2)
+        # Binary patterns as one compact block: 1 byte per bit for every metric pass
+        patterns = np.ascontiguousarray(patterns, dtype=np.uint8)
+        # Patterns may differ from the previous run, so cached scores are stale
+        self._eval_cache.clear()
+        self._distance_cache.clear()
         
         print(f"Optimizing single agent radius using {self.strategy.value}")
         print(f"Search range: {radius_range[0]} to {radius_range[1]}")
@@ -58,32 +103,71 @@ class RadiusOptimizer:
             return self._genetic_algorithm_optimization(sdm_agent, patterns, metric, radius_range)
         elif self.strategy == OptimizationStrategy.GRADIENT_DESCENT:
             return self._gradient_descent_optimization(sdm_agent, patterns, metric, radius_range)
+        elif self.strategy == OptimizationStrategy.SIMULATED_ANNEALING:
+            return self._simulated_annealing_optimization(sdm_agent, patterns, metric, radius_range)
         else:
             # Default to genetic algorithm
             return self._genetic_algorithm_optimization(sdm_agent, patterns, metric, radius_range)
     
     def _brute_force_optimization(self, sdm_agent, patterns: List[np.ndarray], 
-                                metric: PerformanceMetric, radius_range: Tuple[int, int]) -> Dict:
-        """Brute force search over all possible radius values"""
+                                metric: PerformanceMetric, radius_range: Tuple[int, int],
+                                stride: int = 2, patience: int = 3) -> Dict:
+        """
+        Brute force search over the radius range
+
+        A coarse pass visits every `stride`-th radius and stops once the score has
+        fallen below the best for `patience` consecutive steps past the peak; the
+        radii around the best coarse one are then scored individually.
+        """
         
-        best_radius = radius_range[0]
+        min_radius, max_radius = radius_range
+        best_radius = min_radius
         best_score = 0.0
-        results = []
-        
-        for radius in range(radius_range[0], radius_range[1] + 1):
+        scores = {}
+        
+        # Metrics that write patterns depend on the agent's accumulated state, so
+        # scoring them on per-process copies would diverge from the serial search
+        if self.use_multiprocessing and metric in _READ_ONLY_METRICS:
+            # Score the whole range up front across processes; the passes below then hit the cache
+            radii = range(min_radius, max_radius + 1)
+            # spawn, not fork: forking after Numba's threading layer has started hangs the parent at exit
+            with multiprocessing.get_context("spawn").Pool(
+                    initializer=_init_score_worker, initargs=(sdm_agent, patterns, metric)) as pool:
+                chunksize = max(1, len(radii) // (4 * (os.cpu_count() or 1)))
+                for radius, score in zip(radii, pool.map(_score_radius_worker, radii, chunksize=chunksize)):
+                    self._eval_cache[(id(sdm_agent), radius, metric)] = score
+        
+        def visit(radius):
+            nonlocal best_radius, best_score
+            if radius in scores:
+                return scores[radius]
             score = self._evaluate_radius(sdm_agent, patterns, radius, metric)
-            results.append((radius, score))
-            
+            scores[radius] = score
             if score > best_score:
                 best_score = score
                 best_radius = radius
-                
             print(f"  Radius {radius}: score = {score:.4f}")
+            return score
+        
+        # Coarse pass with early stop once the score is past its peak
+        declines = 0
+        for radius in range(min_radius, max_radius + 1, stride):
+            if visit(radius) < best_score:
+                declines += 1
+                if declines >= patience:
+                    break
+            else:
+                declines = 0
+        
+        # Refine at stride 1 around the best coarse radius
+        for radius in range(max(min_radius, best_radius - stride + 1),
+                            min(max_radius, best_radius + stride - 1) + 1):
+            visit(radius)
         
         return {
             'optimal_radius': best_radius,
             'best_score': best_score,
-            'all_results': results,
+            'all_results': sorted(scores.items()),
             'strategy': self.strategy.value,
             'metric': metric.value
         }
@@ -97,46 +181,41 @@ class RadiusOptimizer:
         
         # Initialize population
         population = np.random.randint(min_radius, max_radius + 1, population_size)
+        fitness_scores = np.empty(population_size)
         fitness_history = []
+        tournament_size = min(3, population_size)
+        mutation_rate = 0.1
         
         for generation in range(generations):
-            # Evaluate fitness
-            fitness_scores = []
-            for radius in population:
-                score = self._evaluate_radius(sdm_agent, patterns, radius, metric)
-                fitness_scores.append(score)
+            # Evaluate fitness (repeated radii are cache hits)
+            for i, radius in enumerate(population):
+                fitness_scores[i] = self._evaluate_radius(sdm_agent, patterns, radius, metric)
             
-            fitness_scores = np.array(fitness_scores)
             fitness_history.append(np.max(fitness_scores))
+            best_idx = int(np.argmax(fitness_scores))
+            elite, elite_score = population[best_idx], fitness_scores[best_idx]
             
-            # Selection (tournament selection)
-            new_population = []
-            for _ in range(population_size):
-                # Tournament selection
-                tournament_size = 3
-                tournament_indices = np.random.choice(population_size, tournament_size, replace=False)
-                tournament_fitness = fitness_scores[tournament_indices]
-                winner_idx = tournament_indices[np.argmax(tournament_fitness)]
-                new_population.append(population[winner_idx])
+            # Selection (tournament selection): one row of distinct contestants per slot
+            tournaments = np.random.random((population_size, population_size)).argpartition(
+                tournament_size - 1, axis=1)[:, :tournament_size]
+            winners = tournaments[np.arange(population_size),
+                                  np.argmax(fitness_scores[tournaments], axis=1)]
+            population = population[winners]
             
-            population = np.array(new_population)
+            # Mutation: random radius within range for each slot hit by the mutation rate
+            mutate = np.random.random(population_size) < mutation_rate
+            population = np.where(mutate, np.random.randint(min_radius, max_radius + 1, population_size),
+                                  population)
             
-            # Mutation
-            mutation_rate = 0.1
-            for i in range(population_size):
-                if np.random.random() < mutation_rate:
-                    # Random mutation within range
-                    population[i] = np.random.randint(min_radius, max_radius + 1)
+            # Elitism: the best radius so far always survives into the next generation
+            population[0] = elite
             
             print(f"  Generation {generation + 1}: best fitness = {fitness_history[-1]:.4f}")
         
-        # Return best solution
-        final_fitness = [self._evaluate_radius(sdm_agent, patterns, r, metric) for r in population]
-        best_idx = np.argmax(final_fitness)
-        
+        # Return best solution of the last evaluated generation (it survives as the elite)
         return {
-            'optimal_radius': population[best_idx],
-            'best_score': final_fitness[best_idx],
+            'optimal_radius': int(elite),
+            'best_score': float(elite_score),
             'fitness_history': fitness_history,
             'final_population': population.tolist(),
             'strategy': self.strategy.value,
@@ -145,46 +224,88 @@ class RadiusOptimizer:
     
     def _gradient_descent_optimization(self, sdm_agent, patterns: List[np.ndarray],
                                      metric: PerformanceMetric, radius_range: Tuple[int, int],
-                                     learning_rate: float = 1.0, max_iterations: int = 50) -> Dict:
-        """Gradient descent optimization (adapted for discrete radius values)"""
+                                     max_iterations: int = 50) -> Dict:
+        """
+        Local search over the discrete radius, done as a golden-section search.
+
+        Assumes the score is unimodal in the radius (the usual shape: too small
+        activates nothing, too large blurs patterns together), which needs
+        ~log1.618(range) evaluations instead of stepping one radius at a time.
+        """
         
         min_radius, max_radius = radius_range
-        current_radius = (min_radius + max_radius) // 2  # Start in middle
+        inv_phi = (np.sqrt(5) - 1) / 2
         
         score_history = []
         radius_history = []
         
-        for iteration in range(max_iterations):
-            current_score = self._evaluate_radius(sdm_agent, patterns, current_radius, metric)
-            score_history.append(current_score)
-            radius_history.append(current_radius)
-            
-            # Calculate approximate gradient using finite differences
-            gradient = 0
-            if current_radius > min_radius:
-                left_score = self._evaluate_radius(sdm_agent, patterns, current_radius - 1, metric)
-                gradient += (current_score - left_score)
-            
-            if current_radius < max_radius:
-                right_score = self._evaluate_radius(sdm_agent, patterns, current_radius + 1, metric)
-                gradient += (right_score - current_score)
+        def score(radius):
+            value = self._evaluate_radius(sdm_agent, patterns, radius, metric)
+            score_history.append(value)
+            radius_history.append(radius)
+            return value
+        
+        low, high = min_radius, max_radius
+        iteration = 0
+        while high - low > 2 and iteration < max_iterations:
+            step = int(round((high - low) * inv_phi))
+            left, right = high - step, low + step
+            if left >= right:
+                right = left + 1
             
-            # Update radius based on gradient
-            if gradient > 0.01:  # Threshold to avoid noise
-                new_radius = min(max_radius, current_radius + int(learning_rate))
-            elif gradient < -0.01:
-                new_radius = max(min_radius, current_radius - int(learning_rate))
+            # Keep the side holding the larger probe; the other end cannot contain the peak.
+            # Ties move right: a flat score usually means radii too small to activate anything.
+            if score(left) <= score(right):
+                low = left + 1
             else:
-                break  # Converged
+                high = right - 1
             
-            current_radius = new_radius
-            print(f"  Iteration {iteration + 1}: radius = {current_radius}, score = {current_score:.4f}")
+            iteration += 1
+            print(f"  Iteration {iteration}: bracket = [{low}, {high}]")
         
-        final_score = self._evaluate_radius(sdm_agent, patterns, current_radius, metric)
+        # Only a few radii are left in the bracket: score them all
+        final_scores = {radius: score(radius) for radius in range(low, high + 1)}
+        current_radius = max(final_scores, key=final_scores.get)
         
         return {
             'optimal_radius': current_radius,
-            'best_score': final_score,
+            'best_score': final_scores[current_radius],
+            'score_history': score_history,
+            'radius_history': radius_history,
+            'strategy': self.strategy.value,
+            'metric': metric.value
+        }
+    
+    def _simulated_annealing_optimization(self, sdm_agent, patterns: List[np.ndarray],
+                                          metric: PerformanceMetric, radius_range: Tuple[int, int],
+                                          max_iterations: int = 50) -> Dict:
+        """Simulated annealing over the radius (SciPy dual_annealing, no local search)"""
+        from scipy.optimize import dual_annealing
+        
+        min_radius, max_radius = radius_range
+        score_history = []
+        radius_history = []
+        
+        def objective(x):
+            # Continuous proposals round onto integer radii; repeats are cache hits
+            radius = int(round(x[0]))
+            score = self._evaluate_radius(sdm_agent, patterns, radius, metric)
+            score_history.append(score)
+            radius_history.append(radius)
+            return -score
+        
+        if min_radius == max_radius:
+            objective([min_radius])
+        else:
+            dual_annealing(objective, bounds=[(min_radius, max_radius)], maxiter=max_iterations,
+                           no_local_search=True, seed=np.random.randint(2**31 - 1))
+        
+        best_idx = int(np.argmax(score_history))
+        print(f"  Annealing: {len(set(radius_history))} radii scored, best radius = {radius_history[best_idx]}")
+        
+        return {
+            'optimal_radius': radius_history[best_idx],
+            'best_score': float(score_history[best_idx]),
             'score_history': score_history,
             'radius_history': radius_history,
             'strategy': self.strategy.value,
@@ -193,7 +314,33 @@ class RadiusOptimizer:
     
     def _evaluate_radius(self, sdm_agent, patterns: List[np.ndarray], 
                         radius: int, metric: PerformanceMetric) -> float:
-        """Evaluate performance for a given radius"""
+        """Evaluate performance for a given radius (memoized per agent, radius and metric)"""
+        key = (id(sdm_agent), int(radius), metric)
+        if key not in self._eval_cache:
+            self._eval_cache[key] = self._score_radius(sdm_agent, patterns, radius, metric)
+        return self._eval_cache[key]
+    
+    def _pattern_distances(self, sdm_agent, patterns: np.ndarray) -> Optional[np.ndarray]:
+        """
+        (P, N) Hamming distances from every pattern to every address of the agent.
+
+        Addresses never change while the radius is searched, so one table serves
+        every candidate radius. None when precomputation is disabled.
+        """
+        if not self.use_precomputed_distances:
+            return None
+        key = id(sdm_agent)
+        if key not in self._distance_cache:
+            self._distance_cache[key] = sdm_agent.batch_address_distances(np.asarray(patterns))
+        return self._distance_cache[key]
+    
+    def _score_radius(self, sdm_agent, patterns: List[np.ndarray], 
+                      radius: int, metric: PerformanceMetric) -> float:
+        """Run the metric for a given radius against the agent"""
+        dists = self._pattern_distances(sdm_agent, patterns)
+        if metric == PerformanceMetric.ACTIVATION_RATE:
+            # Read-only: pass the radius through instead of mutating the shared agent
+            return self._calculate_activation_rate(sdm_agent, patterns, radius, dists)
         
         # Temporarily set the radius
         original_radius = sdm_agent.access_radius
@@ -201,85 +348,74 @@ class RadiusOptimizer:
         
         try:
             if metric == PerformanceMetric.MATCH_RATIO:
-                return self._calculate_match_ratio(sdm_agent, patterns)
-            elif metric == PerformanceMetric.ACTIVATION_RATE:
-                return self._calculate_activation_rate(sdm_agent, patterns)
+                return self._calculate_match_ratio(sdm_agent, patterns, dists)
             elif metric == PerformanceMetric.INTERFERENCE_LEVEL:
-                return 1.0 - self._calculate_interference_level(sdm_agent, patterns)
+                return 1.0 - self._calculate_interference_level(sdm_agent, patterns, dists)
             elif metric == PerformanceMetric.RETRIEVAL_ACCURACY:
-                return self._calculate_retrieval_accuracy(sdm_agent, patterns)
+                return self._calculate_retrieval_accuracy(sdm_agent, patterns, dists)
             else:
-                return self._calculate_match_ratio(sdm_agent, patterns)
+                return self._calculate_match_ratio(sdm_agent, patterns, dists)
         finally:
             # Restore original radius
             sdm_agent.access_radius = original_radius
     
-    def _calculate_match_ratio(self, sdm_agent, patterns: List[np.ndarray]) -> float:
-        """Calculate average match ratio for patterns"""
-        match_ratios = []
+    def _calculate_match_ratio(self, sdm_agent, patterns: List[np.ndarray],
+                               dists: Optional[np.ndarray] = None) -> float:
+        """Calculate average match ratio for patterns (`dists`: optional (P, N) distance table)"""
+        patterns = np.asarray(patterns)
+        retrieved = np.empty_like(patterns)
         
-        for pattern in patterns:
-            # Write pattern
-            sdm_agent.write(pattern, strength=1)
-            
-            # Read back
-            retrieved_pattern, confidence = sdm_agent.read(pattern)
-            
-            # Calculate match ratio
-            match_ratio = np.mean(pattern == retrieved_pattern)
-            match_ratios.append(match_ratio)
+        for i, pattern in enumerate(patterns):
+            row = None if dists is None else dists[i]
+            # Write pattern, then read it back before the next one is stored
+            sdm_agent.write(pattern, strength=1, dists=row)
+            retrieved[i], confidence = sdm_agent.read(pattern, dists=row)
         
-        return np.mean(match_ratios)
+        # Per-pattern match ratios over the whole (P, D) block at once
+        return np.mean((patterns == retrieved).mean(axis=1))
     
-    def _calculate_activation_rate(self, sdm_agent, patterns: List[np.ndarray]) -> float:
-        """Calculate average activation rate"""
-        activation_rates = []
-        
-        for pattern in patterns:
-            activated_locations = 0
-            for i, addr in enumerate(sdm_agent.addresses):
-                dist = np.sum(pattern != addr)
-                if dist <= sdm_agent.access_radius:
-                    activated_locations += 1
-            
-            activation_rate = activated_locations / sdm_agent.num_locations
-            activation_rates.append(activation_rate)
-        
-        return np.mean(activation_rates)
+    def _calculate_activation_rate(self, sdm_agent, patterns: List[np.ndarray],
+                                   radius: Optional[int] = None,
+                                   dists: Optional[np.ndarray] = None) -> float:
+        """Calculate average activation rate (at `radius`, default the agent's own)"""
+        if radius is None:
+            radius = sdm_agent.access_radius
+        # (P, N) distance table in one GEMM; the mean over it is the mean per-pattern rate
+        if dists is None:
+            dists = sdm_agent.batch_address_distances(np.asarray(patterns))
+        return np.mean(dists <= radius)
     
-    def _calculate_interference_level(self, sdm_agent, patterns: List[np.ndarray]) -> float:
+    def _calculate_interference_level(self, sdm_agent, patterns: List[np.ndarray],
+                                      dists: Optional[np.ndarray] = None) -> float:
         """Calculate interference between patterns"""
         if len(patterns) < 2:
             return 0.0
         
-        # Store all patterns
-        for pattern in patterns:
-            sdm_agent.write(pattern, strength=1)
+        # Store all patterns in one batched write (same result as writing them in turn)
+        sdm_agent.write_batch(patterns, strength=1, dists=dists)
         
-        # Measure retrieval degradation
-        total_degradation = 0.0
-        for i, pattern in enumerate(patterns):
-            retrieved, confidence = sdm_agent.read(pattern)
-            match_ratio = np.mean(pattern == retrieved)
-            degradation = 1.0 - match_ratio
-            total_degradation += degradation
+        # Measure retrieval degradation: every pattern is stored, so all reads batch
+        patterns = np.asarray(patterns)
+        retrieved, confidences = sdm_agent.read_batch(patterns, dists=dists)
+        match_ratios = (patterns == retrieved).mean(axis=1)
         
-        return total_degradation / len(patterns)
+        return np.mean(1.0 - match_ratios)
     
-    def _calculate_retrieval_accuracy(self, sdm_agent, patterns: List[np.ndarray]) -> float:
+    def _calculate_retrieval_accuracy(self, sdm_agent, patterns: List[np.ndarray],
+                                      dists: Optional[np.ndarray] = None) -> float:
         """Calculate overall retrieval accuracy including confidence"""
-        accuracies = []
+        patterns = np.asarray(patterns)
+        retrieved = np.empty_like(patterns)
+        confidences = np.empty(len(patterns))
         
-        for pattern in patterns:
-            sdm_agent.write(pattern, strength=1)
-            retrieved, confidence = sdm_agent.read(pattern)
-            
-            match_ratio = np.mean(pattern == retrieved)
-            # Weight by confidence
-            weighted_accuracy = match_ratio * confidence
-            accuracies.append(weighted_accuracy)
+        for i, pattern in enumerate(patterns):
+            row = None if dists is None else dists[i]
+            sdm_agent.write(pattern, strength=1, dists=row)
+            retrieved[i], confidences[i] = sdm_agent.read(pattern, dists=row)
         
-        return np.mean(accuracies)
+        match_ratios = (patterns == retrieved).mean(axis=1)
+        # Weight by confidence
+        return np.mean(match_ratios * confidences)
 
 class SwarmRadiusOptimizer:
     """Optimize radius across multiple SDM agents in a swarm"""
@@ -296,13 +432,14 @@ class SwarmRadiusOptimizer:
         
         Args:
             agents: List of SDM agents
-            patterns: List of test patterns  
+            patterns: List of binary test patterns (stacked into a (P, D) uint8 array)
             metric: Performance metric to optimize
             
         Returns:
             Dictionary with swarm optimization results
         """
         print(f"Optimizing radius across {len(agents)} agents using {self.strategy.value}")
+        patterns = np.ascontiguousarray(patterns, dtype=np.uint8)
         
         if self.strategy == OptimizationStrategy.SWARM_CONSENSUS:
             return self._swarm_consensus_optimization(agents, patterns, metric)
@@ -316,24 +453,25 @@ class SwarmRadiusOptimizer:
                                     metric: PerformanceMetric) -> Dict:
         """Distributed consensus-based optimization"""
         
+        # One optimizer per agent for the whole run, so its evaluation cache
+        # carries over from the initial proposal into the consensus rounds
+        optimizers = [RadiusOptimizer(strategy=OptimizationStrategy.BRUTE_FORCE) for _ in agents]
+        
         # Each agent proposes an optimal radius
         proposed_radii = []
-        for agent in agents:
-            optimizer = RadiusOptimizer(strategy=OptimizationStrategy.BRUTE_FORCE)
+        for agent, optimizer in zip(agents, optimizers):
             result = optimizer.optimize_single_agent(
                 agent, patterns, metric,
                 radius_range=(1, agent.vector_dim // 2)
             )
             proposed_radii.append(result['optimal_radius'])
+        proposed_radii = np.asarray(proposed_radii, dtype=np.int64)
 
         # Iteratively move toward consensus
         iteration = 0
         while iteration < self.max_iterations:
-            avg_radius = int(np.mean(proposed_radii))
-            agreement_ratio = np.mean([
-                1 if abs(r - avg_radius) <= 1 else 0
-                for r in proposed_radii
-            ])
+            avg_radius = int(proposed_radii.mean())
+            agreement_ratio = float((np.abs(proposed_radii - avg_radius) <= 1).mean())
 
             print(f"  Iteration {iteration + 1}: avg_radius = {avg_radius}, agreement = {agreement_ratio:.2f}")
 
@@ -342,25 +480,21 @@ class SwarmRadiusOptimizer:
 
             # Agents test new avg_radius and adjust proposal
             new_proposals = []
-            for agent in agents:
-                best_score = -np.inf
-                best_r = avg_radius
-                for candidate_r in [avg_radius - 1, avg_radius, avg_radius + 1]:
-                    if 1 <= candidate_r <= agent.vector_dim // 2:
-                        optimizer = RadiusOptimizer(strategy=OptimizationStrategy.BRUTE_FORCE)
-                        score = optimizer._evaluate_radius(agent, patterns, candidate_r, metric)
-                        if score > best_score:
-                            best_score = score
-                            best_r = candidate_r
+            for agent, optimizer in zip(agents, optimizers):
+                # Only in-range neighbours are scored; radii seen in earlier rounds hit the cache
+                candidates = [candidate_r for candidate_r in (avg_radius - 1, avg_radius, avg_radius + 1)
+                              if 1 <= candidate_r <= agent.vector_dim // 2]
+                best_r = max(candidates, default=avg_radius,
+                             key=lambda candidate_r: optimizer._evaluate_radius(agent, patterns, candidate_r, metric))
                 new_proposals.append(best_r)
-            proposed_radii = new_proposals
+            proposed_radii = np.asarray(new_proposals, dtype=np.int64)
             iteration += 1
 
-        final_radius = int(np.mean(proposed_radii))
+        final_radius = int(proposed_radii.mean())
         return {
             'consensus_radius': final_radius,
             'iterations': iteration + 1,
-            'final_proposals': proposed_radii,
+            'final_proposals': proposed_radii.tolist(),
             'strategy': self.strategy.value,
             'metric': metric.value
         }
@@ -373,12 +507,18 @@ class SwarmRadiusOptimizer:
         group_size = max(3, len(agents) // 3)
         clusters = [agents[i:i + group_size] for i in range(0, len(agents), group_size)]
 
-        cluster_results = []
+        def cluster_consensus(cluster):
+            cluster_optimizer = SwarmRadiusOptimizer(OptimizationStrategy.SWARM_CONSENSUS)
+            return cluster_optimizer._swarm_consensus_optimization(cluster, patterns, metric)['consensus_radius']
+
         for idx, cluster in enumerate(clusters):
             print(f"  Optimizing cluster {idx + 1} with {len(cluster)} agents")
-            cluster_optimizer = SwarmRadiusOptimizer(OptimizationStrategy.SWARM_CONSENSUS)
-            result = cluster_optimizer._swarm_consensus_optimization(cluster, patterns, metric)
-            cluster_results.append(result['consensus_radius'])
+        if _can_use_threads(agents):
+            # Clusters share no agents, so their consensus runs can proceed in parallel
+            with ThreadPoolExecutor(max_workers=min(len(clusters), os.cpu_count() or 1)) as executor:
+                cluster_results = list(executor.map(cluster_consensus, clusters))
+        else:
+            cluster_results = [cluster_consensus(cluster) for cluster in clusters]
 
         # Leaders are represented by their cluster consensus
         print("  Performing global consensus among cluster leaders...")
@@ -1,9 +1,12 @@
 # backend/core/sdm/swarm/swarm_agent.py
 
+import logging
 import numpy as np
 from typing import Dict, List, Optional
 from enum import Enum
+from .. import _kernels
 from ..memory import SparseDistributedMemory
+from ..utils import hamming_distances, num_words, pack_bits, popcount64
 import time
 
 class MessagePriority(Enum):
@@ -12,22 +15,156 @@ class MessagePriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
+# Agent events go through logging (silent unless enabled) rather than print,
+# so message handling does no formatting or stdout writes by default
+log = logging.getLogger(__name__)
+
+# Plain int for the per-message "requires action" comparison
+_HIGH_VAL = MessagePriority.HIGH.value
+
 class CommunicationMode(Enum):
     LIGHTWEIGHT = "lightweight_sharing"
     HIGH_FIDELITY = "high_fidelity_sharing"
 
 class SwarmMessage:
+    # Messages are queued in bulk; slots drop the per-instance __dict__
+    __slots__ = ('sender_id', 'pattern', 'priority', 'priority_val', 'metadata', 'timestamp')
+    
     def __init__(self, sender_id: str, pattern: np.ndarray, 
                  priority: MessagePriority, metadata: Dict):
         self.sender_id = sender_id
         self.pattern = pattern
         self.priority = priority
+        self.priority_val = priority.value
         self.metadata = metadata
-        self.timestamp = time.time()
+        # Monotonic integer nanoseconds: message ages are exact int differences
+        self.timestamp = time.monotonic_ns()
+
+class MessageQueueSoA:
+    """
+    Message queue stored as parallel arrays (one row per message) so the whole
+    queue can be scanned at once. Full binary patterns are packed into uint64
+    words; compressed (index-only) patterns are kept aside and flagged invalid
+    for bitwise comparison. A SwarmMessage is rebuilt only by `get(index)`.
+    """
+    
+    def __init__(self, vector_dim: int, capacity: int = 64):
+        self.vector_dim = vector_dim
+        self._size = 0
+        self.patterns_packed = np.zeros((capacity, num_words(vector_dim)), dtype=np.uint64)
+        self.full_pattern = np.zeros(capacity, dtype=bool)
+        self.priorities = np.zeros(capacity, dtype=np.uint8)
+        self.sender_ids = np.zeros(capacity, dtype=np.int32)
+        self.timestamps = np.zeros(capacity, dtype=np.int64)
+        # Sender id table: sender_ids index into _senders
+        self._senders: List[str] = []
+        self._sender_index: Dict[str, int] = {}
+        self._raw_patterns: List[np.ndarray] = []
+        self._metadata: List[Dict] = []
+    
+    def __len__(self):
+        return self._size
+    
+    def _grow(self):
+        capacity = max(1, 2 * len(self.timestamps))
+        for name in ('patterns_packed', 'full_pattern', 'priorities', 'sender_ids', 'timestamps'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+    
+    def append(self, message: SwarmMessage):
+        """Pack and store a message at the next index"""
+        if self._size == len(self.timestamps):
+            self._grow()
+        i = self._size
+        pattern = np.asarray(message.pattern)
+        if pattern.shape == (self.vector_dim,):
+            self.patterns_packed[i] = pack_bits(pattern)
+            self.full_pattern[i] = True
+            self._raw_patterns.append(None)
+        else:
+            self.patterns_packed[i] = 0
+            self.full_pattern[i] = False
+            self._raw_patterns.append(pattern)
+        if message.sender_id not in self._sender_index:
+            self._sender_index[message.sender_id] = len(self._senders)
+            self._senders.append(message.sender_id)
+        self.sender_ids[i] = self._sender_index[message.sender_id]
+        self.priorities[i] = message.priority_val
+        self.timestamps[i] = message.timestamp
+        self._metadata.append(message.metadata)
+        self._size += 1
+    
+    def get(self, index: int) -> SwarmMessage:
+        """Re-materialize the message stored at `index`"""
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        if self.full_pattern[index]:
+            words = self.patterns_packed[index]
+            pattern = np.unpackbits(words.view(np.uint8), bitorder='little')[:self.vector_dim]
+        else:
+            pattern = self._raw_patterns[index]
+        message = SwarmMessage(self._senders[self.sender_ids[index]], pattern,
+                               MessagePriority(int(self.priorities[index])),
+                               self._metadata[index])
+        message.timestamp = int(self.timestamps[index])
+        return message
+    
+    def is_control(self, index: int) -> bool:
+        """True for pattern-less control messages (e.g. high-fidelity requests)"""
+        raw = self._raw_patterns[index]
+        return (raw is not None and raw.size == 0) or 'request_type' in self._metadata[index]
+    
+    def clear(self):
+        self._size = 0
+        self._raw_patterns.clear()
+        self._metadata.clear()
+    
+    def batch_min_distance(self, known_patterns_packed: np.ndarray) -> np.ndarray:
+        """
+        Minimum Hamming distance from every queued message to the known patterns.
+        
+        Returns a float array of shape (M,); inf for messages without a full
+        pattern or when there are no known patterns.
+        """
+        result = np.full(self._size, np.inf)
+        if self._size == 0 or len(known_patterns_packed) == 0:
+            return result
+        queue = self.patterns_packed[:self._size]
+        # (K, M, W) XOR block reduced over words, then the minimum over known patterns
+        dists = popcount64(known_patterns_packed[:, None, :] ^ queue[None, :, :]).sum(axis=-1)
+        mins = dists.min(axis=0)
+        valid = self.full_pattern[:self._size]
+        result[valid] = mins[valid]
+        return result
+    
+    def analyze(self, known_patterns_packed: np.ndarray, threat_threshold: int,
+                distances: Optional[np.ndarray] = None):
+        """
+        Vectorised process_swarm_message decision for the whole queue.
+        
+        Returns (relevant_mask, action_mask, to_trigger_idx): relevance is a
+        distance under `threat_threshold`, action is HIGH priority or above, and
+        to_trigger_idx lists the messages that satisfy both. `distances` may pass
+        in an existing batch_min_distance result.
+        """
+        if distances is None:
+            distances = self.batch_min_distance(known_patterns_packed)
+        relevant_mask = distances < threat_threshold
+        action_mask = self.priorities[:self._size] >= _HIGH_VAL
+        to_trigger_idx = np.flatnonzero(relevant_mask & action_mask)
+        return relevant_mask, action_mask, to_trigger_idx
 
 class SDMSwarmAgent:
+    __slots__ = ('agent_id', 'agent_type', 'sdm', 'connected_agents', 'message_queue',
+                 'current_task', 'computational_load', 'last_communication_mode',
+                 'threat_threshold', 'confidence_threshold', '_known_patterns',
+                 '_known_count', '_known_next', '_interaction_scratch')
+    
     def __init__(self, agent_id: str, agent_type: str, 
-                 vector_dim: int = 512, num_locations: int = 1000):
+                 vector_dim: int = 512, num_locations: int = 1000,
+                 max_known_patterns: int = 1000):
         self.agent_id = agent_id
         self.agent_type = agent_type  # "camera", "ugv", "sensor", etc.
         
@@ -36,7 +173,7 @@ class SDMSwarmAgent:
         
         # Swarm communication
         self.connected_agents = {}
-        self.message_queue = []
+        self.message_queue = MessageQueueSoA(vector_dim)
         
         # RL state tracking
         self.current_task = None
@@ -47,6 +184,16 @@ class SDMSwarmAgent:
         self.threat_threshold = 30  # Hamming distance
         self.confidence_threshold = 0.8
         
+        # Known patterns packed 64 bits per uint64 word, one row per pattern, in a
+        # preallocated ring buffer (oldest pattern overwritten once full)
+        self._known_patterns = np.zeros((max_known_patterns, num_words(vector_dim)), dtype=np.uint64)
+        self._known_count = 0
+        self._known_next = 0
+        
+        # Reused by encode_interaction (float, like the vectors it used to allocate,
+        # since compressed messages carry index values rather than bits)
+        self._interaction_scratch = np.zeros(vector_dim)
+        
     def get_swarm_state(self):
         """Get current state for RL decision making"""
         return {
@@ -59,12 +206,10 @@ class SDMSwarmAgent:
     
     def detect_pattern(self, input_data: np.ndarray) -> Dict:
         """Detect and classify patterns using SDM"""
-        # Store pattern in SDM
+        # Store pattern in SDM, then retrieve similar patterns for classification
+        # (one address scan serves both)
         pattern_vector = self.preprocess_input(input_data)
-        self.sdm.write(pattern_vector, strength=1)
-        
-        # Retrieve similar patterns for classification
-        recalled_pattern, confidence = self.sdm.read(pattern_vector)
+        recalled_pattern, confidence = self.sdm.write_then_read(pattern_vector, strength=1)
         
         # Classify based on similarity to known patterns
         classification = self.classify_pattern(recalled_pattern, confidence)
@@ -73,7 +218,8 @@ class SDMSwarmAgent:
             'pattern': pattern_vector,
             'classification': classification,
             'confidence': confidence,
-            'timestamp': time.time()
+            # Same clock as SwarmMessage.timestamp so the two can be compared
+            'timestamp': time.monotonic_ns()
         }
     
     def decide_communication_mode(self, detection_result: Dict) -> CommunicationMode:
@@ -123,18 +269,44 @@ class SDMSwarmAgent:
         
         self.send_to_swarm(message)
     
+    @property
+    def current_patterns_packed(self) -> np.ndarray:
+        """View of the stored packed patterns, shape (count, words)"""
+        return self._known_patterns[:self._known_count]
+    
+    def remember_pattern(self, pattern: np.ndarray):
+        """Add a full binary pattern to the known patterns used for relevance checks"""
+        capacity = len(self._known_patterns)
+        if capacity == 0:
+            return
+        self._known_patterns[self._known_next] = pack_bits(pattern)
+        self._known_next = (self._known_next + 1) % capacity
+        self._known_count = min(self._known_count + 1, capacity)
+    
     def process_swarm_message(self, message: SwarmMessage) -> Dict:
         """Process incoming message from swarm"""
-        print(f"{self.agent_id}: Received message from {message.sender_id}")
+        log.info("%s: Received message from %s", self.agent_id, message.sender_id)
         
-        # Calculation of relevance using Hamming distance
-        if hasattr(self, 'current_patterns'):
-            relevance_scores = []
-            for known_pattern in self.current_patterns:
-                distance = np.sum(known_pattern != message.pattern)
-                relevance_scores.append(distance)
-            
-            min_distance = min(relevance_scores) if relevance_scores else float('inf')
+        # Control messages (e.g. high-fidelity requests) carry no pattern to score
+        if np.size(message.pattern) == 0 or 'request_type' in message.metadata:
+            return {
+                'relevant': False,
+                'distance': float('inf'),
+                'requires_action': message.priority_val >= _HIGH_VAL,
+                'classification': message.metadata.get('classification', 'CONTROL')
+            }
+        
+        # Calculation of relevance using Hamming distance (XOR + popcount on packed
+        # words); compressed index-only patterns cannot be compared bitwise
+        pattern = np.asarray(message.pattern)
+        if self._known_count and pattern.shape == (self.sdm.vector_dim,):
+            if self.sdm.use_jit:
+                # Branch-and-bound scan: rows stop once they cannot beat the best
+                min_distance = int(_kernels.min_hamming(self.current_patterns_packed,
+                                                        pack_bits(pattern)))
+            else:
+                distances = hamming_distances(self.current_patterns_packed, pack_bits(pattern))
+                min_distance = int(distances.min())
         else:
             min_distance = float('inf')
         
@@ -142,7 +314,7 @@ class SDMSwarmAgent:
         response = {
             'relevant': min_distance < self.threat_threshold,
             'distance': min_distance,
-            'requires_action': message.priority.value >= MessagePriority.HIGH.value,
+            'requires_action': message.priority_val >= _HIGH_VAL,
             'classification': message.metadata.get('classification', 'UNKNOWN')
         }
         
@@ -151,13 +323,37 @@ class SDMSwarmAgent:
         
         return response
     
+    def process_message_queue(self) -> List[Dict]:
+        """
+        Process every queued message at once (same decisions as calling
+        process_swarm_message on each), then empty the queue.
+        """
+        queue = self.message_queue
+        distances = queue.batch_min_distance(self.current_patterns_packed)
+        relevant_mask, action_mask, to_trigger_idx = queue.analyze(
+            self.current_patterns_packed, self.threat_threshold, distances)
+        
+        responses = [{
+            'relevant': bool(relevant_mask[i]),
+            'distance': int(distances[i]) if np.isfinite(distances[i]) else float('inf'),
+            'requires_action': bool(action_mask[i]),
+            'classification': queue._metadata[i].get('classification',
+                                                     'CONTROL' if queue.is_control(i) else 'UNKNOWN')
+        } for i in range(len(queue))]
+        
+        for i in to_trigger_idx:
+            self.trigger_response_action(queue.get(i), responses[i])
+        
+        queue.clear()
+        return responses
+    
     def trigger_response_action(self, message: SwarmMessage, analysis: Dict):
         """Take action based on swarm communication"""
-        print(f"{self.agent_id}: Taking action based on {message.sender_id}'s message")
+        log.info("%s: Taking action based on %s's message", self.agent_id, message.sender_id)
         
         if self.agent_type == "ugv":
             if "THREAT" in analysis['classification']:
-                print(f"{self.agent_id}: THREAT DETECTED! Switching to investigate mode")
+                log.info("%s: THREAT DETECTED! Switching to investigate mode", self.agent_id)
                 self.current_task = "INVESTIGATE"
                 # Requesting high-fidelity data if needed
                 if not message.metadata.get('full_context', False):
@@ -165,7 +361,7 @@ class SDMSwarmAgent:
         
         elif self.agent_type == "camera":
             if message.sender_id.startswith("ugv"):
-                print(f"{self.agent_id}: UGV requesting assistance, adjusting monitoring")
+                log.info("%s: UGV requesting assistance, adjusting monitoring", self.agent_id)
                 # Adjusting monitoring parameters based on UGV needs
                 self.adjust_monitoring_sensitivity()
     
@@ -181,7 +377,7 @@ class SDMSwarmAgent:
                 'target_classification': 'ALL_THREATS'
             }
         )
-        print(f"{self.agent_id}: Requesting high-fidelity update from {target_agent_id}")
+        log.info("%s: Requesting high-fidelity update from %s", self.agent_id, target_agent_id)
         # Forward to specific agent (implementation depends on communication layer)
     
     def learn_from_swarm_interaction(self, message: SwarmMessage, outcome: str):
@@ -190,32 +386,62 @@ class SDMSwarmAgent:
         if outcome == "SUCCESS":
             interaction_pattern = self.encode_interaction(message)
             self.sdm.write(interaction_pattern, strength=5)  # Reinforce successful patterns
-            print(f"{self.agent_id}: Learning successful interaction pattern")
+            log.info("%s: Learning successful interaction pattern", self.agent_id)
     
     # Utility methods
-    def preprocess_input(self, input_data: np.ndarray) -> np.ndarray:
-        """Convert input to sparse binary vector"""
+    def preprocess_input(self, input_data: np.ndarray, sparse: bool = False) -> np.ndarray:
+        """
+        Convert input to sparse binary vector
+        
+        With sparse=True the int32 indices of the active bits are returned instead
+        (~3% of the dense size; use sdm.write_sparse / read_sparse and
+        utils.sparse_hamming on them).
+        """
         if len(input_data.shape) > 1:
             input_data = input_data.flatten()
         
         # Create sparse representation (threshold top 3% of values)
-        threshold = np.percentile(input_data, 97)
-        sparse_vector = (input_data > threshold).astype(int)
+        threshold = self._percentile_select(input_data, 97)
+        sparse_vector = (input_data > threshold).astype(np.uint8)
         
         # Ensure minimum sparsity
-        if np.sum(sparse_vector) == 0:
+        if not sparse_vector.any():
             # If no values above threshold, take top 2% of indices
-            top_indices = np.argsort(input_data)[-int(len(input_data) * 0.02):]
+            k = int(len(input_data) * 0.02)
+            top_indices = np.argpartition(input_data, -k)[-k:] if k else slice(None)
             sparse_vector[top_indices] = 1
-            
+        
+        if sparse:
+            return np.flatnonzero(sparse_vector).astype(np.int32)
         return sparse_vector
     
-    def classify_pattern(self, pattern: np.ndarray, confidence: float) -> str:
-        """Simple pattern classification"""
+    @staticmethod
+    def _percentile_select(values: np.ndarray, q: float) -> float:
+        """
+        np.percentile(values, q) (linear interpolation) using a partial sort:
+        np.partition selects the two bracketing order statistics in O(n).
+        """
+        position = (len(values) - 1) * (q / 100.0)
+        lo = int(np.floor(position))
+        hi = min(lo + 1, len(values) - 1)
+        selected = np.partition(values, [lo, hi])
+        # Order statistics stay NumPy scalars so the lerp runs in the input's
+        # precision (float32 stays float32), as np.percentile's does
+        a, b = selected[lo], selected[hi]
+        t = position - lo
+        diff = b - a
+        # Same two-sided lerp as NumPy so the threshold matches bit for bit
+        if t >= 0.5:
+            return float(b - diff * (1 - t))
+        return float(a + diff * t)
+    
+    def classify_pattern(self, pattern: np.ndarray, confidence: float,
+                         ones_count: Optional[int] = None) -> str:
+        """Simple pattern classification (`ones_count`: number of set bits, if already known)"""
         # This would be replaced with more sophisticated classification
-        pattern_sum = np.sum(pattern)
-        
         if confidence > 0.9:
+            # Only confident recalls need the ones count
+            pattern_sum = np.count_nonzero(pattern) if ones_count is None else ones_count
             if pattern_sum < 10:
                 return "BACKGROUND"
             elif pattern_sum < 30:
@@ -228,8 +454,11 @@ class SDMSwarmAgent:
     def compress_pattern(self, pattern: np.ndarray) -> np.ndarray:
         """Compress pattern for lightweight sharing"""
         # Simple compression: keep only most significant bits
-        indices = np.where(pattern == 1)[0]
-        return indices[:10]  # keeping only top 10 active indices
+        # (top 10 active indices; the JIT scan stops once it has found them)
+        pattern = np.ravel(pattern)
+        if self.sdm.use_jit:
+            return _kernels.first_k_ones(pattern, 10)
+        return np.flatnonzero(pattern == 1)[:10].astype(np.int32)
     
     def get_position(self):
         """Get agent position (placeholder)"""
@@ -241,25 +470,31 @@ class SDMSwarmAgent:
     
     def send_to_swarm(self, message: SwarmMessage):
         """Send message to swarm (placeholder)"""
-        print(f"{self.agent_id}: Broadcasting {message.priority.name} priority message")
+        log.info("%s: Broadcasting %s priority message", self.agent_id, message.priority.name)
     
     def adjust_monitoring_sensitivity(self):
         """Adjust monitoring parameters"""
-        print(f"{self.agent_id}: Adjusting monitoring sensitivity")
+        log.info("%s: Adjusting monitoring sensitivity", self.agent_id)
         self.threat_threshold = max(20, self.threat_threshold - 5)
     
     def encode_interaction(self, message: SwarmMessage) -> np.ndarray:
-        """Encode interaction for learning"""
+        """
+        Encode interaction for learning
+        
+        Returns the agent's scratch buffer, overwritten by the next call; copy it
+        to keep it (sdm.write does not hold on to its input).
+        """
         # pattern representing this interaction type
-        interaction_vector = np.zeros(self.sdm.vector_dim)
-        interaction_vector[:len(message.pattern)] = message.pattern[:self.sdm.vector_dim]
+        interaction_vector = self._interaction_scratch
+        interaction_vector.fill(0)
+        n = min(len(message.pattern), interaction_vector.size)
+        interaction_vector[:n] = message.pattern[:n]
         return interaction_vector
 
 
 # Example usage demonstration
 def create_camera_ugv_swarm_demo():
     """Demonstrate camera-UGV swarm interaction"""
-    
     # Create agents
     camera = SDMSwarmAgent("camera_001", "camera", vector_dim=256, num_locations=500)
     ugv = SDMSwarmAgent("ugv_001", "ugv", vector_dim=256, num_locations=500)
@@ -318,4 +553,6 @@ def create_camera_ugv_swarm_demo():
     return camera, ugv
 
 if __name__ == "__main__":
+    # Show the agents' event log alongside the demo narrative
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     camera, ugv = create_camera_ugv_swarm_demo()
\ No newline at end of file
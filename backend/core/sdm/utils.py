@@ -0,0 +1,116 @@
+import base64
+
+import numpy as np
+
+try:
+    import cupy
+    CUPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only with a CUDA build
+    cupy = None
+    CUPY_AVAILABLE = False
+
+# NumPy >= 2.0 lowers np.bitwise_count to POPCNT (x86) / CNT (NEON); older
+# releases fall back to a byte lookup table
+_HAS_BITWISE_COUNT = hasattr(np, 'bitwise_count')
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def get_array_module(device: str = 'cpu'):
+    """cupy for device='cuda' when CuPy is installed, numpy otherwise"""
+    if device == 'cuda' and CUPY_AVAILABLE:
+        return cupy
+    return np
+
+
+def to_numpy(array) -> np.ndarray:
+    """Copy a device (CuPy) array back to the host; NumPy arrays pass through"""
+    if CUPY_AVAILABLE:
+        return cupy.asnumpy(array)
+    return np.asarray(array)
+
+
+def num_words(dim: int) -> int:
+    """Number of uint64 words needed to hold `dim` bits"""
+    return (dim + 63) // 64
+
+
+def pack_bits(vectors) -> np.ndarray:
+    """
+    Pack binary vectors into uint64 words (64 bits per word, zero padded).
+
+    Args:
+        vectors: binary array (0/1) of shape (D,) or (N, D)
+    Returns:
+        uint64 array of shape (ceil(D/64),) or (N, ceil(D/64))
+    """
+    bits = np.asarray(vectors) != 0
+    pad = num_words(bits.shape[-1]) * 64 - bits.shape[-1]
+    if pad:
+        bits = np.pad(bits, [(0, 0)] * (bits.ndim - 1) + [(0, pad)])
+    return np.packbits(bits, axis=-1, bitorder='little').view(np.uint64)
+
+
+def unpack_bits(words: np.ndarray, dim: int) -> np.ndarray:
+    """Inverse of `pack_bits`: expand uint64 words back into a (…, dim) uint8 array"""
+    bits = np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=-1, bitorder='little')
+    return bits[..., :dim]
+
+
+def indices_to_bits(indices, dim: int) -> np.ndarray:
+    """Dense (dim,) uint8 binary vector with ones at `indices` (sparse index-set form)"""
+    bits = np.zeros(dim, dtype=np.uint8)
+    bits[np.asarray(indices, dtype=np.intp)] = 1
+    return bits
+
+
+def sparse_hamming(indices_a, indices_b) -> int:
+    """Hamming distance between two index-set patterns: size of their symmetric difference"""
+    return int(np.setxor1d(indices_a, indices_b).size)
+
+
+def bits_to_base64(vector) -> str:
+    """
+    Encode a binary vector as base64 of its packed bytes (np.packbits, MSB first).
+
+    A 1024-bit vector becomes 172 characters instead of a 1024-element JSON list.
+    Decode with base64 -> bytes -> np.unpackbits(...)[:dim] (or atob + Uint8Array).
+    """
+    return base64.b64encode(np.packbits(np.asarray(vector) != 0).tobytes()).decode('ascii')
+
+
+def base64_to_bits(encoded: str, dim: int) -> np.ndarray:
+    """Inverse of `bits_to_base64`"""
+    packed = np.frombuffer(base64.b64decode(encoded), dtype=np.uint8)
+    return np.unpackbits(packed)[:dim]
+
+
+def popcount64(words: np.ndarray) -> np.ndarray:
+    """Per-word population count of a uint64 array"""
+    if _HAS_BITWISE_COUNT:
+        return np.bitwise_count(words)
+    words = np.ascontiguousarray(words)
+    return _POPCOUNT8[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1)
+
+
+def _row_popcount(words: np.ndarray) -> np.ndarray:
+    """Total set bits along the last axis of a uint64 (NumPy or CuPy) array, as int64"""
+    xp = cupy.get_array_module(words) if CUPY_AVAILABLE else np
+    if hasattr(xp, 'bitwise_count'):
+        return xp.bitwise_count(words).sum(axis=-1, dtype=xp.int64)
+    table = _POPCOUNT8 if xp is np else xp.asarray(_POPCOUNT8)
+    return table[xp.ascontiguousarray(words).view(xp.uint8)].sum(axis=-1, dtype=xp.int64)
+
+
+def hamming_distances(packed_matrix: np.ndarray, packed_vector: np.ndarray) -> np.ndarray:
+    """
+    Hamming distance between a packed vector and every row of a packed matrix.
+
+    Both arguments must live on the same device (NumPy or CuPy arrays).
+
+    Args:
+        packed_matrix: uint64 array of shape (N, W)
+        packed_vector: uint64 array of shape (W,)
+    Returns:
+        int64 array of shape (N,)
+    """
+    return _row_popcount(np.bitwise_xor(packed_matrix, packed_vector))
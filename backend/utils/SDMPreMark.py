@@ -1,12 +1,24 @@
 import sys
+import os
+import multiprocessing
+from functools import lru_cache
 from pathlib import Path
 import csv
+import gzip
+import hashlib
+import json
 import time
 from itertools import product
 from datetime import datetime
 
-sys.path.append(str(Path(__file__).parent.parent))
-from core.sdm.memory import run_sdm_memory_test
+import numpy as np
+
+# Import through the `backend` package (as the API does) so Numba's on-disk
+# kernel cache always sees the same module names
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from backend.core.sdm.memory import (SparseDistributedMemory, run_sdm_memory_test,
+                                     run_sdm_memory_test_sweep, generate_addresses,
+                                     generate_sparse_vector)
 
 # Parameter ranges
 vector_dims = [32, 64, 128, 256, 512, 1024]
@@ -14,9 +26,25 @@ num_locations_list = [500, 1000, 3000, 5000, 8000]
 access_radius_factors = [0.05, 0.1, 0.2, 0.4, 0.6, 0.78, 0.9]
 reinforce_cycles = [1, 5, 10, 15, 30, 50, 100]
 
+# Sweep rows are written in batches of this many (plus a final flush)
+CSV_FLUSH_ROWS = 64
+# Write buffer for sweep CSV files
+CSV_BUFFER_SIZE = 1 << 20
+# duration_seconds in the comprehensive and focused CSVs is a per-radius
+# average: all radii of a cell share one memory and distance scan, and the
+# cell's wall time is divided by its number of radii
+
 # Base output directory structure
 BASE_OUTPUT_DIR = Path(__file__).parent.parent / "api" / "tests" / "SDMPreMark"
 
+# Sources whose contents key the cell cache: editing any of them invalidates it
+CELL_CACHE_SOURCES = [
+    Path(__file__),
+    Path(__file__).parent.parent / "core" / "sdm" / "memory.py",
+    Path(__file__).parent.parent / "core" / "sdm" / "_kernels.py",
+    Path(__file__).parent.parent / "core" / "sdm" / "utils.py",
+]
+
 def get_csv_output_path(test_type: str, description: str = ""):
     """
     Generate organized CSV output path with incremental naming
@@ -35,19 +63,25 @@ def get_csv_output_path(test_type: str, description: str = ""):
     # Generate timestamp and find next available number
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Find highest existing test number
-    existing_files = list(test_dir.glob(f"{test_type}_*.csv"))
-    max_num = 0
-    for file in existing_files:
-        try:
-            # Extract number from filename like "focused_001_20241225_123456.csv"
-            parts = file.stem.split('_')
-            if len(parts) >= 2 and parts[1].isdigit():
-                max_num = max(max_num, int(parts[1]))
-        except (ValueError, IndexError):
-            continue
+    # Last issued test number is kept in a counter file; the directory is only
+    # scanned for the highest existing number when the counter is missing
+    counter_path = test_dir / ".counter"
+    try:
+        max_num = int(counter_path.read_text())
+    except (FileNotFoundError, ValueError):
+        existing_files = list(test_dir.glob(f"{test_type}_*.csv"))
+        max_num = 0
+        for file in existing_files:
+            try:
+                # Extract number from filename like "focused_001_20241225_123456.csv"
+                parts = file.stem.split('_')
+                if len(parts) >= 2 and parts[1].isdigit():
+                    max_num = max(max_num, int(parts[1]))
+            except (ValueError, IndexError):
+                continue
     
     next_num = max_num + 1
+    counter_path.write_text(str(next_num))
     
     # Create filename with incremental number and timestamp
     if description:
@@ -72,63 +106,261 @@ def estimate_runtime():
     
     return total_configs
 
-def run_comprehensive_benchmark():
-    """Run full parameter sweep"""
-    total_configs = estimate_runtime()
-    
-    csv_output_path = get_csv_output_path("comprehensive", "full_sweep")
+def _init_sweep_worker():
+    """
+    Pin each pool worker's Numba kernels to one thread (the pool already uses
+    every core) and load them with one tiny scan/write/read per address width,
+    so a worker's first cell is not timed with the import and cache load.
+    """
+    try:
+        import numba
+        numba.set_num_threads(1)
+    except ImportError:
+        pass
+    for vector_dim in (64, 128):
+        sdm = SparseDistributedMemory(vector_dim=vector_dim, num_locations=8,
+                                      access_radius=vector_dim, seed=0)
+        vector = np.zeros(vector_dim, dtype=np.uint8)
+        dists = sdm.address_distances(vector)
+        sdm.write_repeated(vector, 1, dists=dists)
+        sdm.read(vector, dists=dists)
+
+def _sweep_pool(max_workers: int = None):
+    """
+    Process pool for benchmark sweeps (default: one worker per core).
+
+    Workers are spawned, not forked: forking after Numba's thread pool has
+    started can hang the interpreter.
+    """
+    return multiprocessing.get_context("spawn").Pool(max_workers or os.cpu_count(),
+                                                     initializer=_init_sweep_worker)
+
+def _code_fingerprint() -> str:
+    """Hash of CELL_CACHE_SOURCES, so cached rows never outlive the code that produced them"""
+    digest = hashlib.sha1()
+    for path in CELL_CACHE_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def _cell_cache_path(cache_dir: Path, fingerprint: str, run_config, config) -> Path:
+    """Content-addressed cache file of one config's rows"""
+    key = repr((fingerprint, run_config.__name__, config)).encode()
+    return cache_dir / f"{hashlib.sha1(key).hexdigest()}.ndjson.gz"
+
+def _run_cached_config(task):
+    """
+    (rows, cached) of one config: from the cell cache, or run_config's rows (then cached).
+
+    Cells are deterministic (seeded addresses and inputs), so a cached cell is
+    what a rerun would compute, except for its recorded duration.
+    """
+    run_config, config, cache = task
+    if cache is None:
+        return run_config(config), False
+    cache_dir, fingerprint = cache
+    path = _cell_cache_path(cache_dir, fingerprint, run_config, config)
+    if path.exists():
+        with gzip.open(path, "rt") as f:
+            return [json.loads(line) for line in f], True
+    rows = run_config(config)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp_path, "wt") as f:
+        f.writelines(json.dumps(row) + "\n" for row in rows)
+    os.replace(tmp_path, path)
+    return rows, False
+
+def _uncached_duration(row, duration_column):
+    """Blank the replayed duration of a cached row (it was not measured in this run)"""
+    if duration_column is not None:
+        row[duration_column] = ""
+    return row
+
+def run_sweep(run_config, configs, csv_output_path, header, max_workers: int = None,
+              chunksize: int = 1, on_row=None, use_cache: bool = False):
+    """
+    Enumerate, dispatch and collate one benchmark sweep.
     
-    with open(csv_output_path, mode="w", newline="") as file:
+    Args:
+        run_config: top-level (picklable) function mapping one config tuple to a
+                    list of CSV rows
+        configs: iterable of config tuples, enumerated once
+        csv_output_path: CSV file to write
+        header: CSV header row
+        max_workers: pool size (default: one worker per core)
+        chunksize: configs handed to a worker at a time
+        on_row: optional callback(config_count, row) for progress output
+        use_cache: reuse rows of configs already run with the same code
+                   (gzipped NDJSON under BASE_OUTPUT_DIR/cell_cache). Cached
+                   rows are not re-timed, so their duration_seconds is left
+                   empty; off by default so a benchmark run measures everything
+    
+    Rows are written by the main process as configs complete (imap_unordered),
+    so a slow large cell never holds back the rows of cells finished after it;
+    sort the CSV if config order matters. The file is synced to disk once,
+    after the last row.
+    """
+    cache = None
+    if use_cache:
+        # Resolved here, not in the workers, which re-import this module
+        cache_dir = BASE_OUTPUT_DIR / "cell_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache = (cache_dir, _code_fingerprint())
+    tasks = ((run_config, config, cache) for config in configs)
+    duration_column = header.index("duration_seconds") if "duration_seconds" in header else None
+    
+    with open(csv_output_path, mode="w", newline="", buffering=CSV_BUFFER_SIZE) as file:
         writer = csv.writer(file)
-        writer.writerow([
-            "vector_dim", "num_locations", "access_radius", 
-            "reinforce", "match_ratio", "input_ones_count",
-            "recalled_ones_count", "duration_seconds", 
-            "radius_factor", "sparsity_ratio"
+        writer.writerow(header)
+        
+        with _sweep_pool(max_workers) as pool:
+            pending = []
+            rows = (_uncached_duration(row, duration_column) if cached else row
+                    for config_rows, cached in pool.imap_unordered(_run_cached_config, tasks,
+                                                                   chunksize=chunksize)
+                    for row in config_rows)
+            for config_count, row in enumerate(rows, start=1):
+                pending.append(row)
+                if len(pending) >= CSV_FLUSH_ROWS:
+                    writer.writerows(pending)
+                    pending.clear()
+                if on_row is not None:
+                    on_row(config_count, row)
+            writer.writerows(pending)
+        
+        file.flush()
+        os.fsync(file.fileno())
+
+@lru_cache(maxsize=None)
+def _dim_fixtures(vector_dim):
+    """
+    Packed addresses for the largest swept memory of `vector_dim` and the input
+    vector written and recalled by every cell of that dimension, generated
+    once per worker process.
+
+    Address rows are independent draws, so every cell of that dimension uses
+    the first num_locations rows instead of generating its own table. The
+    generator is seeded with vector_dim, so every worker builds the same
+    fixtures and cells differ only in their swept parameters.
+    """
+    rng = np.random.default_rng(vector_dim)
+    table = generate_addresses(vector_dim, max(num_locations_list), rng=rng)
+    input_vector = generate_sparse_vector(vector_dim, sparsity=0.03, rng=rng)
+    return table, input_vector
+
+def _radius_sweep(vector_dim, num_locations, radii, reinforce):
+    """
+    Results for every radius of one (vector_dim, num_locations, reinforce) cell,
+    plus the average time per radius (the cell's wall time / len(radii)).
+
+    The radii share one address table, input and distance scan
+    (run_sdm_memory_test_sweep), so no radius can be timed on its own; the
+    duration_seconds column therefore holds this average, not a single run.
+    The input is the shared per-dimension vector, so match ratios compare
+    across cells and reruns reproduce the CSV.
+    """
+    table, input_vector = _dim_fixtures(vector_dim)
+    # Memories larger than the shared table generate their own addresses
+    addresses = table[:num_locations] if num_locations <= len(table) else None
+    start_time = time.perf_counter()
+    results = run_sdm_memory_test_sweep(
+        vector_dim=vector_dim,
+        num_locations=num_locations,
+        radii=radii,
+        reinforce=reinforce,
+        addresses=addresses,
+        seed=(vector_dim, num_locations, reinforce),
+        input_vector=input_vector
+    )
+    duration = (time.perf_counter() - start_time) / len(radii)
+    return results, duration
+
+def _run_comprehensive_config(config):
+    """Run one comprehensive-sweep cell across all radius factors and return its CSV rows"""
+    vector_dim, num_locations, reinforce, factors, radii = config
+    results, duration = _radius_sweep(vector_dim, num_locations, radii, reinforce)
+    
+    rows = []
+    for factor, access_radius, result in zip(factors, radii, results):
+        summary = result["summary"]
+        
+        sparsity_ratio = summary["input_ones_count"] / vector_dim if vector_dim > 0 else 0
+
+        rows.append([
+            vector_dim, num_locations, access_radius, reinforce,
+            summary["match_ratio"],
+            summary["input_ones_count"],
+            summary["recalled_ones_count"],
+            round(duration, 4),
+            round(factor, 3),
+            round(sparsity_ratio, 4)
         ])
+    return rows
 
-        config_count = 0
-        for vector_dim, num_locations, factor, reinforce in product(
-            vector_dims, num_locations_list, access_radius_factors, reinforce_cycles
-        ):
-            config_count += 1
-            access_radius = max(1, int(vector_dim * factor))
-            
-            print(f"Config {config_count}/{total_configs}: dim={vector_dim}, "
-                  f"locs={num_locations}, r={access_radius}, reinforce={reinforce}")
-            
-            start_time = time.perf_counter()
-            result = run_sdm_memory_test(
-                vector_dim=vector_dim,
-                num_locations=num_locations,
-                access_radius=access_radius,
-                reinforce=reinforce
-            )
-            duration = time.perf_counter() - start_time
+def run_comprehensive_benchmark(max_workers: int = None):
+    """
+    Run full parameter sweep
+    
+    Each (vector_dim, num_locations, reinforce) cell runs every radius factor
+    against one memory; cells are independent, so they run in a process pool
+    (default: one worker per core) and rows are written by the main process.
+    """
+    total_configs = estimate_runtime()
+    
+    csv_output_path = get_csv_output_path("comprehensive", "full_sweep")
+    
+    configs = (
+        (vector_dim, num_locations, reinforce, access_radius_factors,
+         [max(1, int(vector_dim * factor)) for factor in access_radius_factors])
+        for vector_dim, num_locations, reinforce in product(
+            vector_dims, num_locations_list, reinforce_cycles)
+    )
+    
+    def on_row(config_count, row):
+        vector_dim, num_locations, access_radius, reinforce = row[:4]
+        print(f"Config {config_count}/{total_configs}: dim={vector_dim}, "
+              f"locs={num_locations}, r={access_radius}, reinforce={reinforce}")
+        if config_count % 50 == 0:
+            print(f"Progress: {config_count}/{total_configs} ({100*config_count/total_configs:.1f}%)")
+    
+    run_sweep(_run_comprehensive_config, configs, csv_output_path, [
+        "vector_dim", "num_locations", "access_radius", 
+        "reinforce", "match_ratio", "input_ones_count",
+        "recalled_ones_count", "duration_seconds", 
+        "radius_factor", "sparsity_ratio"
+    ], max_workers=max_workers, on_row=on_row)
 
-            summary = result.get("summary", {
-                "match_ratio": result.get("match_ratio", None),
-                "input_ones_count": sum(result.get("input_vector", [])),
-                "recalled_ones_count": sum(result.get("recalled_vector", []))
-            })
-            
-            sparsity_ratio = summary["input_ones_count"] / vector_dim if vector_dim > 0 else 0
+def _activation_regime(factor):
+    if factor < 0.3:
+        return "under_activation"
+    elif factor < 0.5:
+        return "transition"
+    return "over_activation"
 
-            writer.writerow([
-                vector_dim, num_locations, access_radius, reinforce,
-                summary["match_ratio"],
-                summary["input_ones_count"],
-                summary["recalled_ones_count"],
-                round(duration, 4),
-                round(factor, 3),
-                round(sparsity_ratio, 4)
-            ])
+def _run_focused_config(config):
+    """Run one focused-sweep cell across its radius factors and return its CSV rows"""
+    vector_dim, num_locations, reinforce, factors, radii = config
+    results, duration = _radius_sweep(vector_dim, num_locations, radii, reinforce)
+    
+    rows = []
+    for factor, access_radius, result in zip(factors, radii, results):
+        summary = result["summary"]
+        
+        sparsity_ratio = summary["input_ones_count"] / vector_dim if vector_dim > 0 else 0
 
-            if config_count % 50 == 0:
-                print(f"Progress: {config_count}/{total_configs} ({100*config_count/total_configs:.1f}%)")
+        rows.append([
+            vector_dim, num_locations, access_radius, reinforce,
+            summary["match_ratio"],
+            summary["input_ones_count"], 
+            summary["recalled_ones_count"],
+            round(duration, 4),
+            round(factor, 3),
+            round(sparsity_ratio, 4),
+            _activation_regime(factor)
+        ])
+    return rows
 
-def run_focused_benchmark():
-    """Run targeted subsets for specific research questions"""
+def run_focused_benchmark(max_workers: int = None):
+    """Run targeted subsets for specific research questions (in a process pool)"""
     
     focus_dims = [128, 512]
     focus_locations = [1000, 5000]
@@ -140,65 +372,47 @@ def run_focused_benchmark():
     
     csv_output_path = get_csv_output_path("focused", "reinforcement_analysis")
     
-    with open(csv_output_path, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow([
-            "vector_dim", "num_locations", "access_radius", 
-            "reinforce", "match_ratio", "input_ones_count",
-            "recalled_ones_count", "duration_seconds", 
-            "radius_factor", "sparsity_ratio", "performance_regime"
-        ])
-
-        config_count = 0
-        for vector_dim, num_locations, factor, reinforce in product(
-            focus_dims, focus_locations, focus_factors, reinforce_cycles
-        ):
-            config_count += 1
-            access_radius = max(1, int(vector_dim * factor))
-            
-            start_time = time.perf_counter()
-            result = run_sdm_memory_test(
-                vector_dim=vector_dim,
-                num_locations=num_locations,
-                access_radius=access_radius,
-                reinforce=reinforce
-            )
-            duration = time.perf_counter() - start_time
-
-            summary = result.get("summary", {
-                "match_ratio": result.get("match_ratio", None),
-                "input_ones_count": sum(result.get("input_vector", [])),
-                "recalled_ones_count": sum(result.get("recalled_vector", []))
-            })
-            
-            sparsity_ratio = summary["input_ones_count"] / vector_dim if vector_dim > 0 else 0
-            
-            if factor < 0.3:
-                regime = "under_activation"
-            elif factor < 0.5:
-                regime = "transition"
-            else:
-                regime = "over_activation"
+    configs = [
+        (vector_dim, num_locations, reinforce, focus_factors,
+         [max(1, int(vector_dim * factor)) for factor in focus_factors])
+        for vector_dim, num_locations, reinforce in product(
+            focus_dims, focus_locations, reinforce_cycles)
+    ]
+    
+    def on_row(config_count, row):
+        if config_count % 25 == 0:
+            print(f"Progress: {config_count}/{total_configs} ({100*config_count/total_configs:.1f}%)")
+        vector_dim, _, access_radius, reinforce, match_ratio = row[:5]
+        print(f"Done: dim={vector_dim}, r={access_radius}, reinforce={reinforce}, "
+              f"match={match_ratio:.3f}")
+    
+    run_sweep(_run_focused_config, configs, csv_output_path, [
+        "vector_dim", "num_locations", "access_radius", 
+        "reinforce", "match_ratio", "input_ones_count",
+        "recalled_ones_count", "duration_seconds", 
+        "radius_factor", "sparsity_ratio", "performance_regime"
+    ], max_workers=max_workers, on_row=on_row)
 
-            writer.writerow([
-                vector_dim, num_locations, access_radius, reinforce,
-                summary["match_ratio"],
-                summary["input_ones_count"], 
-                summary["recalled_ones_count"],
-                round(duration, 4),
-                round(factor, 3),
-                round(sparsity_ratio, 4),
-                regime
-            ])
+def _run_critical_config(config):
+    """Run one critical-radius cell across all fine factors and return its CSV rows"""
+    vector_dim, reinforce, factors, radii = config
+    results, _ = _radius_sweep(vector_dim, 1000, radii, reinforce)
+    
+    rows = []
+    for factor, access_radius, result in zip(factors, radii, results):
+        summary = result["summary"]
+        
+        success_binary = 1 if summary["match_ratio"] > 0.8 else 0
+        input_sparsity = summary["input_ones_count"] / vector_dim if vector_dim > 0 else 0
 
-            if config_count % 25 == 0:
-                print(f"Progress: {config_count}/{total_configs} ({100*config_count/total_configs:.1f}%)")
-                
-            print(f"Done: dim={vector_dim}, r={access_radius}, reinforce={reinforce}, "
-                  f"match={summary['match_ratio']:.3f}")
+        rows.append([
+            vector_dim, access_radius, round(factor, 3), reinforce,
+            summary["match_ratio"], success_binary, round(input_sparsity, 4)
+        ])
+    return rows
 
-def run_critical_radius_mapping():
-    """Map critical radius more precisely across reinforcement levels"""
+def run_critical_radius_mapping(max_workers: int = None):
+    """Map critical radius more precisely across reinforcement levels (in a process pool)"""
     
     print("Running critical radius mapping...")
     
@@ -211,42 +425,22 @@ def run_critical_radius_mapping():
     
     csv_output_path = get_csv_output_path("critical", "radius_mapping")
     
-    with open(csv_output_path, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow([
-            "vector_dim", "access_radius", "radius_factor", "reinforce", 
-            "match_ratio", "success_binary", "input_sparsity"
-        ])
-
-        config_count = 0
-        for vector_dim in test_dims:
-            for factor in fine_factors:
-                for reinforce in [1, 10, 30, 100]:
-                    config_count += 1
-                    access_radius = max(1, int(vector_dim * factor))
-                    
-                    result = run_sdm_memory_test(
-                        vector_dim=vector_dim,
-                        num_locations=1000,
-                        access_radius=access_radius,
-                        reinforce=reinforce
-                    )
-
-                    summary = result.get("summary", {
-                        "match_ratio": result.get("match_ratio", None),
-                        "input_ones_count": sum(result.get("input_vector", []))
-                    })
-                    
-                    success_binary = 1 if summary["match_ratio"] > 0.8 else 0
-                    input_sparsity = summary["input_ones_count"] / vector_dim if vector_dim > 0 else 0
-
-                    writer.writerow([
-                        vector_dim, access_radius, round(factor, 3), reinforce,
-                        summary["match_ratio"], success_binary, round(input_sparsity, 4)
-                    ])
-                    
-                    print(f"Critical mapping {config_count}/{total_configs}: dim={vector_dim}, "
-                          f"factor={factor:.3f}, reinforce={reinforce}, success={success_binary}")
+    configs = [
+        (vector_dim, reinforce, fine_factors,
+         [max(1, int(vector_dim * factor)) for factor in fine_factors])
+        for vector_dim in test_dims
+        for reinforce in [1, 10, 30, 100]
+    ]
+    
+    def on_row(config_count, row):
+        vector_dim, _, factor, reinforce, _, success_binary = row[:6]
+        print(f"Critical mapping {config_count}/{total_configs}: dim={vector_dim}, "
+              f"factor={factor:.3f}, reinforce={reinforce}, success={success_binary}")
+    
+    run_sweep(_run_critical_config, configs, csv_output_path, [
+        "vector_dim", "access_radius", "radius_factor", "reinforce", 
+        "match_ratio", "success_binary", "input_sparsity"
+    ], max_workers=max_workers, on_row=on_row)
 
 def test_dense_vs_sparse():
     """Quick test to compare dense vs sparse encoding"""
@@ -1,9 +1,18 @@
-import argparse
+import sys
+from pathlib import Path
+
+# The encoder lives in the backend package at the repository root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+USAGE = "usage: cli.py {encode TEXT | store VECTOR | query VECTOR}"
 
 def encode(text):
-    # Placeholder: implement your text → SDR encoding here
+    """Encode text as an SDR; returns the base64 packed bits (the server's VectorInput format)"""
+    # Imported here so store/query do not pay for NumPy and the backend
+    from backend.core.sdm.encoder import encode_text
+    from backend.core.sdm.utils import bits_to_base64
     print(f"Encoding text: {text}")
-    return "binary_vector_placeholder"
+    return bits_to_base64(encode_text(text))
 
 def store(vector):
     # Placeholder: implement your SDM store logic here
@@ -14,31 +23,31 @@ def query(vector):
     print(f"Querying vector: {vector}")
     return "query_result_placeholder"
 
-def main():
-    parser = argparse.ArgumentParser(description="SDM CLI tool")
-    subparsers = parser.add_subparsers(dest="command")
-
-    encode_parser = subparsers.add_parser("encode")
-    encode_parser.add_argument("text", help="Text to encode")
-
-    store_parser = subparsers.add_parser("store")
-    store_parser.add_argument("vector", help="Vector to store")
-
-    query_parser = subparsers.add_parser("query")
-    query_parser.add_argument("vector", help="Vector to query")
-
-    args = parser.parse_args()
-
-    if args.command == "encode":
-        vec = encode(args.text)
-        print(f"Encoded vector: {vec}")
-    elif args.command == "store":
-        store(args.vector)
-    elif args.command == "query":
-        result = query(args.vector)
-        print(f"Query result: {result}")
-    else:
-        parser.print_help()
+def _encode_command(text):
+    vec = encode(text)
+    print(f"Encoded vector: {vec}")
+
+def _query_command(vector):
+    result = query(vector)
+    print(f"Query result: {result}")
+
+# Plain sys.argv dispatch: no argparse import or subparser setup on every
+# invocation, which matters when the CLI is run once per item in a script
+COMMANDS = {
+    "encode": _encode_command,
+    "store": store,
+    "query": _query_command,
+}
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] in ("-h", "--help"):
+        print(USAGE)
+        return
+    if len(args) != 2 or args[0] not in COMMANDS:
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+    COMMANDS[args[0]](args[1])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,25 +1,104 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from fastapi import FastAPI, HTTPException
+from pydantic import Base64Bytes, BaseModel, Field, model_validator
+
+# Set before the backend imports Numba. SDM kernels are launched from the one
+# SDM thread below, which workqueue supports; TBB (Numba's first choice) hangs
+# at interpreter exit once parallel kernels have run off the main thread
+os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+
+# The encoder lives in the backend package at the repository root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from backend.core.sdm.encoder import encode_text
+from backend.core.sdm.memory import SparseDistributedMemory
+from backend.core.sdm.utils import bits_to_base64
 
 app = FastAPI()
 
+# The server's memory, sized from the environment. Both addresses and encoded
+# text are ~3% dense, so at 1024 bits a radius of 53 activates ~5% of locations
+sdm = SparseDistributedMemory(
+    vector_dim=int(os.environ.get("SDM_VECTOR_DIM", 1024)),
+    num_locations=int(os.environ.get("SDM_NUM_LOCATIONS", 1000)),
+    access_radius=int(os.environ.get("SDM_ACCESS_RADIUS", 53))
+)
+# Every SDM call runs on this one thread: it serialises access to the shared
+# counters, and the workqueue layer must not launch kernels from several threads
+_sdm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sdm")
+
 class TextInput(BaseModel):
     text: str
+    dim: int = Field(1024, ge=8, le=65536)
 
 class VectorInput(BaseModel):
-    vector: str
+    # base64 of the np.packbits bytes (MSB first): 8x smaller than a "0101..." string
+    vector: Base64Bytes
+    dim: int = Field(ge=0)
+
+    @model_validator(mode="after")
+    def check_length(self):
+        if len(self.vector) * 8 < self.dim:
+            raise ValueError(f"vector holds fewer than {self.dim} bits")
+        return self
+
+    def bits(self) -> np.ndarray:
+        """Unpacked (dim,) uint8 vector"""
+        return np.unpackbits(np.frombuffer(self.vector, dtype=np.uint8))[:self.dim]
+
+class BatchVectorInput(BaseModel):
+    # Packed like VectorInput.vector, all of the same dim
+    vectors: list[Base64Bytes]
+    dim: int = Field(ge=0)
+
+    @model_validator(mode="after")
+    def check_lengths(self):
+        if any(len(vector) * 8 < self.dim for vector in self.vectors):
+            raise ValueError(f"every vector must hold at least {self.dim} bits")
+        return self
+
+    def bits(self) -> np.ndarray:
+        """Unpacked (B, dim) uint8 matrix, one vector per row"""
+        row_bytes = (self.dim + 7) // 8
+        packed = np.frombuffer(b"".join(vector[:row_bytes] for vector in self.vectors),
+                               dtype=np.uint8).reshape(len(self.vectors), row_bytes)
+        return np.unpackbits(packed, axis=1)[:, :self.dim]
+
+def _check_dim(dim: int):
+    if dim != sdm.vector_dim:
+        raise HTTPException(status_code=422, detail=f"dim must be {sdm.vector_dim}, got {dim}")
+
+# SDM store/query is CPU-bound (popcount over every address), so it runs on
+# the SDM thread instead of blocking the event loop
+async def _run_sdm(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(_sdm_executor, func, *args)
 
 @app.post("/encode")
-async def encode_text(input: TextInput):
-    # TODO: implement text to SDR encoding
-    return {"vector": "binary_vector_placeholder"}
+async def encode(input: TextInput):
+    # Same {"vector", "dim"} shape as VectorInput, so the reply can be posted to /store
+    vector = encode_text(input.text, input.dim)
+    return {"vector": bits_to_base64(vector), "dim": input.dim}
 
 @app.post("/store")
 async def store_vector(input: VectorInput):
-    # TODO: implement SDM store logic
-    return {"status": "stored", "vector": input.vector}
+    _check_dim(input.dim)
+    activated = await _run_sdm(sdm.write, input.bits())
+    return {"status": "stored", "vector_length": input.dim, "activated_locations": activated}
 
 @app.post("/query")
 async def query_vector(input: VectorInput):
-    # TODO: implement SDM query logic
-    return {"result": "query_result_placeholder"}
\ No newline at end of file
+    _check_dim(input.dim)
+    recalled, confidence = await _run_sdm(sdm.read, input.bits())
+    return {"vector": bits_to_base64(recalled), "dim": input.dim, "confidence": float(confidence)}
+
+@app.post("/query_batch")
+async def query_batch(input: BatchVectorInput):
+    _check_dim(input.dim)
+    recalled, confidences = await _run_sdm(sdm.read_batch, input.bits())
+    return {"vectors": [bits_to_base64(vector) for vector in recalled], "dim": input.dim,
+            "confidences": [float(confidence) for confidence in confidences]}
\ No newline at end of file